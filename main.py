@@ -9,22 +9,21 @@ This script:
 
 Usage:
     python main.py
+
+The workflow modules (LangGraph, LangChain, OpenAI) are imported lazily,
+so the banner and environment check appear before they are loaded.
 """
 
+import asyncio
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.orchestration.execution import execute_workflow, validate_workflow_output
-from src.utils.file_writer import (
-    write_json_output,
-    ensure_output_directory,
-    read_json_input,
-    get_output_summary
-)
+from dotenv import load_dotenv
 
 
 def print_banner():
@@ -56,6 +55,8 @@ def load_input_data(input_path: str = "data/input/product_data.json") -> dict:
     Returns:
         Product data dictionary
     """
+    from src.utils.file_writer import read_json_input
+    
     try:
         data = read_json_input(input_path)
         print(f" Loaded input: {input_path}")
@@ -72,10 +73,14 @@ def save_outputs(state: dict, output_dir: str = "output"):
     """
     Save all generated outputs to JSON files.
     
+    The files are independent, so they are written concurrently.
+    
     Args:
         state: Final system state with all generated content
         output_dir: Output directory
     """
+    from src.utils.file_writer import write_json_output, ensure_output_directory
+    
     ensure_output_directory(output_dir)
     
     outputs = [
@@ -87,11 +92,17 @@ def save_outputs(state: dict, output_dir: str = "output"):
     print("\n Saving outputs:")
     print("─" * 60)
     
-    for filename, content in outputs:
-        if content:
-            write_json_output(content, filename, output_dir)
-        else:
-            print(f"  Skipped: {filename} (not generated)")
+    with ThreadPoolExecutor(max_workers=len(outputs)) as executor:
+        futures = []
+        for filename, content in outputs:
+            if content:
+                futures.append(executor.submit(write_json_output, content, filename, output_dir))
+            else:
+                print(f"  Skipped: {filename} (not generated)")
+        
+        # Surface any write error once every file has been attempted
+        for future in futures:
+            future.result()
 
 
 def print_execution_summary(state: dict, start_time: datetime):
@@ -102,6 +113,8 @@ def print_execution_summary(state: dict, start_time: datetime):
         state: Final system state
         start_time: Workflow start time
     """
+    from src.utils.file_writer import get_output_summary
+    
     end_time = datetime.now()
     duration = (end_time - start_time).total_seconds()
     
@@ -163,7 +176,12 @@ def print_output_preview(state: dict):
 def check_environment():
     """
     Check if required environment variables and files exist.
+    
+    Returns:
+        True if the workflow can run (OPENAI_API_KEY is set)
     """
+    load_dotenv()
+    
     print("\n Environment Check:")
     print("─" * 60)
     
@@ -173,7 +191,7 @@ def check_environment():
     else:
         print(" OPENAI_API_KEY not set - set it in .env file")
         print("   Format: OPENAI_API_KEY=sk-xxx...")
-        sys.exit(1)
+        return False
     
     if Path("data/input/product_data.json").exists():
         print(" Input file found: data/input/product_data.json")
@@ -184,6 +202,8 @@ def check_environment():
         print(" Output directory exists")
     else:
         print(" Output directory will be created")
+    
+    return True
 
 
 def main():
@@ -194,19 +214,22 @@ def main():
     print_system_info()
     
     
-    check_environment()
+    if not check_environment():
+        return 1
     
     print("\n STARTING WORKFLOW EXECUTION")
     print("=" * 60)
     start_time = datetime.now()
     
+    from src.orchestration.execution import execute_workflow, validate_workflow_output
+    
     try:
     
         raw_data = load_input_data()
         
       
         print("\n Executing multi-agent workflow...")
-        state = execute_workflow(raw_data)
+        state = asyncio.run(execute_workflow(raw_data))
         
         
         validation = validate_workflow_output(state)
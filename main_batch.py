@@ -0,0 +1,181 @@
+"""
+Batch entry point for the Agentic Content Generation System.
+
+This script:
+1. Loads every product from data/input/*.json
+2. Executes the multi-agent workflow for many products concurrently
+3. Saves each product's pages to output/<product-slug>/
+
+Input files may contain a single product object, a list of products,
+or an object with a top-level "products" list.
+
+Usage:
+    python main_batch.py
+"""
+
+import asyncio
+import os
+import re
+import sys
+from pathlib import Path
+from datetime import datetime
+from typing import Any, Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from main import check_environment, save_outputs
+
+
+# Number of product workflows allowed in flight at once
+MAX_CONCURRENT_PRODUCTS = int(os.getenv("BATCH_MAX_CONCURRENCY", "4"))
+
+
+def load_batch_inputs(input_dir: str = "data/input") -> List[Dict[str, Any]]:
+    """
+    Load all products from the JSON files in a directory.
+
+    Args:
+        input_dir: Directory containing product JSON files
+
+    Returns:
+        List of raw product dictionaries
+    """
+    from src.utils.file_writer import read_json_input
+
+    products = []
+
+    for input_path in sorted(Path(input_dir).glob("*.json")):
+        try:
+            data = read_json_input(str(input_path))
+        except ValueError as e:
+            print(f" Skipping invalid input file: {e}")
+            continue
+
+        if isinstance(data, dict) and "products" in data:
+            data = data["products"]
+
+        if isinstance(data, list):
+            products.extend(data)
+        else:
+            products.append(data)
+
+        print(f" Loaded input: {input_path}")
+
+    return products
+
+
+def product_slug(raw_data: Dict[str, Any], index: int) -> str:
+    """
+    Build a filesystem-safe output directory name for a product.
+
+    Args:
+        raw_data: Raw product dictionary
+        index: Position of the product in the batch (used as fallback)
+
+    Returns:
+        Slug such as "glowboost-vitamin-c-serum"
+    """
+    name = str(raw_data.get("name", "")).lower() if isinstance(raw_data, dict) else ""
+    slug = re.sub(r"[^a-z0-9]+", "-", name).strip("-")
+    return slug or f"product-{index + 1}"
+
+
+async def run_batch(
+    products: List[Dict[str, Any]],
+    output_dir: str = "output"
+) -> List[Dict[str, Any]]:
+    """
+    Run the workflow for every product and save the generated pages.
+
+    Workflows run concurrently (bounded by MAX_CONCURRENT_PRODUCTS), so
+    total wall time is driven by LLM throughput rather than by the sum of
+    per-product latencies. Ingredients the knowledge base does not cover
+    are looked up for the whole batch in one LLM call up front.
+
+    Args:
+        products: Raw product dictionaries
+        output_dir: Root output directory
+
+    Returns:
+        Per-product validation reports
+    """
+    # Imported here so the workflow stack only loads once a batch runs
+    from src.logic_blocks import get_ingredient_info_batch
+    from src.orchestration.execution import execute_workflow, validate_workflow_output
+
+    await get_ingredient_info_batch(
+        ingredient
+        for raw_data in products
+        if isinstance(raw_data, dict)
+        for ingredient in raw_data.get("ingredients", [])
+        if isinstance(ingredient, str)
+    )
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_PRODUCTS)
+
+    async def run_one(index: int, raw_data: Dict[str, Any]) -> Dict[str, Any]:
+        async with semaphore:
+            state = await execute_workflow(raw_data)
+
+        product_dir = str(Path(output_dir) / product_slug(raw_data, index))
+        await asyncio.to_thread(save_outputs, state, product_dir)
+
+        validation = validate_workflow_output(state)
+        validation["output_dir"] = product_dir
+        return validation
+
+    return await asyncio.gather(*(
+        run_one(index, raw_data) for index, raw_data in enumerate(products)
+    ))
+
+
+def print_batch_summary(reports: List[Dict[str, Any]], start_time: datetime):
+    """
+    Print a summary of the batch run.
+
+    Args:
+        reports: Per-product validation reports
+        start_time: Batch start time
+    """
+    duration = (datetime.now() - start_time).total_seconds()
+    failed = [r for r in reports if not r["all_required_outputs_present"]]
+
+    print("\n BATCH COMPLETED")
+    print("=" * 60)
+    print(f"  Duration: {duration:.2f} seconds")
+    print(f" Products: {len(reports)}")
+    print(f" Complete: {len(reports) - len(failed)}")
+    print(f" Incomplete: {len(failed)}")
+
+    for report in failed:
+        print(f"   - {report['output_dir']}: missing {report['missing_outputs']}")
+
+
+def main():
+    """Batch entry point."""
+    if not check_environment():
+        return 1
+
+    products = load_batch_inputs()
+    if not products:
+        print(" No products found in data/input")
+        return 1
+
+    print(f"\n STARTING BATCH EXECUTION ({len(products)} products)")
+    print("=" * 60)
+    start_time = datetime.now()
+
+    try:
+        reports = asyncio.run(run_batch(products))
+        print_batch_summary(reports, start_time)
+        return 0 if all(r["all_required_outputs_present"] for r in reports) else 1
+
+    except Exception as e:
+        print(f"\n FATAL ERROR: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
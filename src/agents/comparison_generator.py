@@ -4,35 +4,74 @@ Agent 6: Comparison Generator Agent
 Responsibility: Generate fictional Product B and create comparison page
 Input: product (ProductModel)
 Output: comparison_page (ComparisonPageModel)
-LLM Usage: YES (generate Product B + recommendation)
+LLM Usage: YES (recommendation; Product B is rule-based)
 """
 
-from datetime import datetime
-from pydantic import BaseModel
+import random
+import re
+import zlib
 from src.models.product import ProductModel
 from src.models.pages import ComparisonPageModel
 from src.orchestration.state import SystemState, add_error
 from src.logic_blocks import generate_comparison_block
-from src.utils.llm_client import get_structured_llm, get_llm
-import json
+from src.utils.llm_client import ainvoke_llm, get_llm
+from src.utils.logger import flush_logs, logger
 
 
-class ProductData(BaseModel):
-    """Container for product data from LLM."""
-    name: str
-    concentration: str
-    skin_types: list
-    ingredients: list
-    benefits: list
-    usage: str
-    side_effects: str
-    price: float
+# Brand names for the fictional competitor
+COMPETITOR_NAME_POOL = (
+    "ClarityGlow",
+    "VitaLift",
+    "RadianceBoost",
+    "PureDerm",
+    "LumiSkin",
+    "DermaBloom",
+)
 
+COMPETITOR_NAME_SUFFIXES = ("Serum", "Concentrate", "Formula")
 
-def comparison_generator_agent(state: SystemState) -> SystemState:
+# Like-for-like replacements used when swapping competitor ingredients
+INGREDIENT_SUBSTITUTES = {
+    "vitamin c": "Ascorbyl Glucoside",
+    "hyaluronic acid": "Sodium Hyaluronate",
+    "niacinamide": "Zinc PCA",
+    "retinol": "Bakuchiol",
+    "salicylic acid": "Willow Bark Extract",
+    "glycolic acid": "Lactic Acid",
+    "ferulic acid": "Vitamin E",
+    "vitamin e": "Squalane",
+    "ceramides": "Panthenol",
+}
+
+# Replacements for ingredients without a like-for-like substitute, used
+# in order so each swap yields a distinct ingredient
+DEFAULT_SUBSTITUTES = (
+    "Botanical Extract Blend",
+    "Green Tea Extract",
+    "Centella Asiatica Extract",
+    "Licorice Root Extract",
+    "Aloe Vera",
+    "Allantoin",
+    "Panthenol",
+    "Squalane",
+)
+
+COMPETITOR_EXTRA_BENEFIT = "Lightweight texture"
+
+# Smallest price Product B can get (ProductModel requires price > 0)
+MIN_PRICE = 0.01
+
+_CONCENTRATION_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*%(.*)$")
+
+
+async def comparison_generator_agent(state: SystemState) -> SystemState:
     """
     Generate comparison page with fictional competitor product.
     
+    Product B is derived from Product A without an LLM call; the
+    recommendation call is awaited, so this agent does not hold a thread
+    while it overlaps with the other page agents.
+    
     Args:
         state: System state with parsed product
         
@@ -40,31 +79,31 @@ def comparison_generator_agent(state: SystemState) -> SystemState:
         Updated state with comparison_page
     """
     
-    print("\n" + "="*60)
-    print("  AGENT 6: Comparison Generator")
-    print("="*60)
+    logger.info("\n" + "="*60)
+    logger.info("  AGENT 6: Comparison Generator")
+    logger.info("="*60)
     
     try:
         product_a = state.get("product")
         
         if not product_a:
             error_msg = "Product not found in state"
-            print(f" {error_msg}")
+            logger.error(f" {error_msg}")
             return add_error(state, error_msg)
         
-        print(f" Input: {product_a.name}")
+        logger.info(f" Input: {product_a.name}")
         
        
-        print(" Generating fictional competitor product...")
+        logger.info(" Generating fictional competitor product...")
         product_b = _generate_fictional_product(product_a)
         
     
-        print(" Generating comparison matrix...")
+        logger.info(" Generating comparison matrix...")
         comparison_data = generate_comparison_block(product_a, product_b)
         
      
-        print(" Generating recommendation...")
-        recommendation = _generate_recommendation(product_a, product_b, comparison_data)
+        logger.info(" Generating recommendation...")
+        recommendation = await _generate_recommendation(product_a, product_b, comparison_data)
         
         # Create comparison page
         comparison_page = ComparisonPageModel(
@@ -72,133 +111,119 @@ def comparison_generator_agent(state: SystemState) -> SystemState:
             product_b=product_b,
             comparison_matrix=comparison_data.get("matrix", []),
             recommendation=recommendation,
-            generated_at=datetime.utcnow()
+            generated_at=state["generated_at"]
         )
         
         state["comparison_page"] = comparison_page
         
        
-        log = state.get("execution_log", [])
-        log.append(f" Agent 6 (Comparison Generator): Generated comparison with {product_b.name}")
-        state["execution_log"] = log
+        state["execution_log"].append(f" Agent 6 (Comparison Generator): Generated comparison with {product_b.name}")
         
-        print(f" Success: Comparison page generated")
-        print(f"   Product A: {product_a.name}")
-        print(f"   Product B: {product_b.name}")
-        print(f"   Dimensions compared: {len(comparison_data.get('matrix', []))}")
+        logger.info(f" Success: Comparison page generated")
+        logger.info(f"   Product A: {product_a.name}")
+        logger.info(f"   Product B: {product_b.name}")
+        logger.info(f"   Dimensions compared: {len(comparison_data.get('matrix', []))}")
         
         return state
         
     except Exception as e:
         error_msg = f"Comparison generation failed: {str(e)}"
-        print(f" {error_msg}")
+        logger.error(f" {error_msg}")
         state = add_error(state, error_msg)
         return state
+    
+    finally:
+        flush_logs()
 
 
 def _generate_fictional_product(product_a: ProductModel) -> ProductModel:
     """
     Generate a realistic fictional competitor product.
-    """
-    llm = get_llm(temperature=0.7)
     
-    prompt = f"""You are a market analyst creating a realistic competitor product for comparison purposes.
-
-Original Product:
-- Name: {product_a.name}
-- Concentration: {product_a.concentration}
-- Skin Types: {', '.join(product_a.skin_types)}
-- Ingredients: {', '.join(product_a.ingredients)}
-- Benefits: {', '.join(product_a.benefits)}
-- Usage: {product_a.usage}
-- Side Effects: {product_a.side_effects}
-- Price: ₹{product_a.price}
-
-Create a REALISTIC fictional competitor product with these requirements:
-
-1. Name: Different brand name (professional skincare style)
-   Example formats: "ClarityGlow Serum", "VitaLift Concentrate", "RadianceBoost Formula"
-
-2. Price: Within ±30% of ₹{product_a.price}
-
-3. Concentration: Similar category but different percentage
-
-4. Ingredients: 50-70% overlap
-
-5. Benefits: 50-80% overlap
-
-6. Skin Types: Can be slightly different
-
-7. Side Effects: Realistic and believable
-
-8. Usage: Similar routine but can vary
-
-Make the competitor product REALISTIC - it should feel like a real product that exists in the market, not perfect or dramatically better.
-
-Generate the complete product data now. Respond ONLY with this JSON format, no other text:
-{{
-    "name": "Product Name",
-    "concentration": "percentage",
-    "skin_types": ["type1", "type2"],
-    "ingredients": ["ing1", "ing2"],
-    "benefits": ["benefit1", "benefit2"],
-    "usage": "usage instructions",
-    "side_effects": "possible side effects",
-    "price": number
-}}"""
+    The competitor is derived from Product A with rules instead of an LLM
+    call: a brand from the name pool, a price within ±30%, a different
+    concentration and 30-50% of the ingredients swapped. The random
+    choices are seeded from Product A's name, so the same input always
+    yields the same competitor.
     
-    try:
-        response = llm.invoke(prompt)
-        content = response.content
+    Args:
+        product_a: The product being compared
         
-        # Parse JSON
-        start_idx = content.find('{')
-        end_idx = content.rfind('}') + 1
-        if start_idx >= 0 and end_idx > start_idx:
-            json_str = content[start_idx:end_idx]
-            product_data = json.loads(json_str)
-            
-            return ProductModel(
-                name=product_data.get("name", "Competitor Serum"),
-                concentration=product_data.get("concentration", product_a.concentration),
-                skin_types=product_data.get("skin_types", product_a.skin_types),
-                ingredients=product_data.get("ingredients", product_a.ingredients),
-                benefits=product_data.get("benefits", product_a.benefits),
-                usage=product_data.get("usage", product_a.usage),
-                side_effects=product_data.get("side_effects", product_a.side_effects),
-                price=float(product_data.get("price", product_a.price))
-            )
-    except Exception as e:
-        print(f" LLM product generation failed: {e}, using fallback")
-        return _generate_fallback_product_b(product_a)
-
-
-def _generate_fallback_product_b(product_a: ProductModel) -> ProductModel:
-    """
-    Generate a fallback fictional product if LLM fails.
+    Returns:
+        The fictional competitor (Product B)
     """
+    # crc32 rather than hash(): str hashes are randomized per process
+    seed = zlib.crc32(product_a.name.encode("utf-8"))
+    rng = random.Random(seed)
+    
+    # Avoid Product A's own brand, unless the name contains every brand
+    brands = [b for b in COMPETITOR_NAME_POOL if b.lower() not in product_a.name.lower()] or COMPETITOR_NAME_POOL
+    name = f"{brands[seed % len(brands)]} {rng.choice(COMPETITOR_NAME_SUFFIXES)}"
+    
+    # Cents, never below the smallest valid price (low prices must not round to 0)
+    price = max(MIN_PRICE, round(product_a.price * rng.uniform(0.7, 1.3), 2))
+    
+    concentration = product_a.concentration
+    match = _CONCENTRATION_RE.match(concentration)
+    if match:
+        percent = float(match.group(1)) * rng.choice((0.5, 0.75, 1.5, 2.0))
+        concentration = f"{percent:g}%{match.group(2)}"
     
-  
-    new_price = product_a.price * 1.15
+    ingredients = _swap_ingredients(list(product_a.ingredients), rng)
     
-  
-    new_ingredients = product_a.ingredients.copy()
-    if len(new_ingredients) > 0:
-        new_ingredients[0] = new_ingredients[0] + " (Enhanced)"
+    benefits = list(product_a.benefits)
+    if len(benefits) > 2:
+        benefits[-1] = COMPETITOR_EXTRA_BENEFIT
+    else:
+        benefits.append(COMPETITOR_EXTRA_BENEFIT)
     
     return ProductModel(
-        name=f"Premium {product_a.name.split()[0]} Competitor",
-        concentration=f"{int(float(product_a.concentration.split('%')[0]) * 0.95)}% Active",
+        name=name,
+        concentration=concentration,
         skin_types=product_a.skin_types,
-        ingredients=new_ingredients,
-        benefits=product_a.benefits,
+        ingredients=ingredients,
+        benefits=benefits,
         usage=product_a.usage,
         side_effects=product_a.side_effects,
-        price=new_price
+        price=price
     )
 
 
-def _generate_recommendation(
+def _swap_ingredients(ingredients: list, rng: random.Random) -> list:
+    """
+    Replace 30-50% (at least one) of the ingredients with substitutes.
+    
+    Only swaps that actually change an ingredient count towards the
+    target, and no ingredient appears twice. An empty list (possible for
+    unvalidated input) yields a single default ingredient, so Product B
+    stays valid.
+    """
+    if not ingredients:
+        return [DEFAULT_SUBSTITUTES[0]]
+    
+    target = max(1, round(len(ingredients) * rng.uniform(0.3, 0.5)))
+    used = {ingredient.lower() for ingredient in ingredients}
+    defaults = (d for d in DEFAULT_SUBSTITUTES if d.lower() not in used)
+    swapped = 0
+    
+    for index in rng.sample(range(len(ingredients)), len(ingredients)):
+        if swapped == target:
+            break
+        
+        substitute = INGREDIENT_SUBSTITUTES.get(ingredients[index].lower())
+        if substitute is None or substitute.lower() in used:
+            substitute = next(defaults, None)
+            if substitute is None:
+                break
+        
+        used.add(substitute.lower())
+        ingredients[index] = substitute
+        swapped += 1
+    
+    return ingredients
+
+
+async def _generate_recommendation(
     product_a: ProductModel,
     product_b: ProductModel,
     comparison_data: dict
@@ -218,14 +243,14 @@ def _generate_recommendation(
 Product A: {product_a.name}
 - Price: ₹{product_a.price}
 - Concentration: {product_a.concentration}
-- Skin Types: {', '.join(product_a.skin_types)}
-- Key Benefits: {', '.join(product_a.benefits)}
+- Skin Types: {product_a.skin_types_csv}
+- Key Benefits: {product_a.benefits_csv}
 
 Product B: {product_b.name}
 - Price: ₹{product_b.price}
 - Concentration: {product_b.concentration}
-- Skin Types: {', '.join(product_b.skin_types)}
-- Key Benefits: {', '.join(product_b.benefits)}
+- Skin Types: {product_b.skin_types_csv}
+- Key Benefits: {product_b.benefits_csv}
 
 Comparison Results:
 {matrix_text}
@@ -244,9 +269,9 @@ Write an objective recommendation (3-5 sentences, 100-200 words):
 Keep it professional, objective, and helpful. No marketing fluff."""
     
     try:
-        response = llm.invoke(prompt)
+        response = await ainvoke_llm(llm, prompt)
         return response.content
     except Exception as e:
-        print(f" Recommendation generation failed: {e}")
+        logger.warning(f" Recommendation generation failed: {e}")
         # Fallback recommendation
         return f"Both {product_a.name} and {product_b.name} are excellent skincare products. Choose based on your specific skin type and budget preferences. {product_a.name} offers proven benefits, while {product_b.name} provides an alternative formulation. Patch test before full use."
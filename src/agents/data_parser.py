@@ -10,53 +10,62 @@ LLM Usage: NO (pure validation)
 from pydantic import ValidationError
 from src.models.product import ProductModel
 from src.orchestration.state import SystemState, add_error
+from src.utils.logger import flush_logs, logger
 
 
-def data_parser_agent(state: SystemState) -> SystemState:
+def data_parser_agent(state: SystemState, trusted: bool = False) -> SystemState:
     """
     Parse and validate raw input data.
     
+    Trusted input (e.g. a re-run of data that already passed validation)
+    is loaded with `model_construct`, which skips the validators.
+    
     Args:
         state: System state with raw_data
+        trusted: Skip validation; also enabled by state["trusted_input"]
         
     Returns:
         Updated state with parsed product
     """
     
-    print("\n" + "="*60)
-    print(" AGENT 1: Data Parser")
-    print("="*60)
+    logger.info("\n" + "="*60)
+    logger.info(" AGENT 1: Data Parser")
+    logger.info("="*60)
     
     try:
-        raw_data = state.get("raw_data", {})
+        raw_data = state["raw_data"]
         
-        print(f" Input: Raw data with {len(raw_data)} fields")
+        logger.info(f" Input: Raw data with {len(raw_data)} fields")
         
      
-        product = ProductModel(**raw_data)
+        if trusted or state["trusted_input"]:
+            product = ProductModel.model_construct(**raw_data)
+        else:
+            product = ProductModel(**raw_data)
         
         state["product"] = product
         
         
-        log = state.get("execution_log", [])
-        log.append(f" Agent 1 (Data Parser): Product validated - {product.name}")
-        state["execution_log"] = log
+        state["execution_log"].append(f" Agent 1 (Data Parser): Product validated - {product.name}")
         
-        print(f" Success: Product validated")
-        print(f"   Name: {product.name}")
-        print(f"   Price: ₹{product.price}")
-        print(f"   Skin Types: {', '.join(product.skin_types)}")
+        logger.info(f" Success: Product validated")
+        logger.info(f"   Name: {product.name}")
+        logger.info(f"   Price: ₹{product.price}")
+        logger.info(f"   Skin Types: {product.skin_types_csv}")
         
         return state
         
     except ValidationError as e:
         error_msg = f"Product validation failed: {str(e)}"
-        print(f" {error_msg}")
+        logger.error(f" {error_msg}")
         state = add_error(state, error_msg)
         return state
     
     except Exception as e:
         error_msg = f"Unexpected error in data parser: {str(e)}"
-        print(f" {error_msg}")
+        logger.error(f" {error_msg}")
         state = add_error(state, error_msg)
         return state
+    
+    finally:
+        flush_logs()
@@ -7,14 +7,44 @@ Output: faq_page (FAQPageModel)
 LLM Usage: YES (answer generation)
 """
 
+import logging
+from collections import defaultdict
 from typing import List
-from datetime import datetime
 from pydantic import BaseModel, Field
 from src.models.product import ProductModel
 from src.models.question import QuestionModel, QuestionAnswerModel
 from src.models.pages import FAQPageModel
 from src.orchestration.state import SystemState, add_error
-from src.utils.llm_client import get_llm
+from src.utils.llm_client import ainvoke_llm, get_structured_llm
+from src.utils.logger import flush_logs, logger
+
+
+FAQ_ANSWER_TEMPLATE = """You are a knowledgeable skincare expert. Answer these customer questions about a product.
+
+Product Information:
+- Name: {name}
+- Concentration: {concentration}
+- Skin Types: {skin_types}
+- Key Ingredients: {ingredients}
+- Benefits: {benefits}
+- Usage: {usage}
+- Side Effects: {side_effects}
+- Price: ₹{price}
+
+Customer Questions:
+{questions}
+
+For EACH question, provide a helpful, accurate answer (2-4 sentences).
+
+Guidelines:
+- Be friendly and professional
+- Base answers ONLY on the product information provided
+- Don't make claims beyond what's stated
+- Be honest about side effects and limitations
+- Include practical tips where relevant
+- Keep answers concise but complete
+
+Generate answers for all {question_count} questions. Return each question exactly as written, together with its category and your answer."""
 
 
 class AnswerList(BaseModel):
@@ -22,7 +52,7 @@ class AnswerList(BaseModel):
     answers: List[QuestionAnswerModel] = Field(..., description="List of Q&A pairs")
 
 
-def faq_generator_agent(state: SystemState) -> SystemState:
+async def faq_generator_agent(state: SystemState) -> SystemState:
     """
     Generate FAQ page with questions and answers.
     
@@ -33,9 +63,9 @@ def faq_generator_agent(state: SystemState) -> SystemState:
         Updated state with faq_page
     """
     
-    print("\n" + "="*60)
-    print(" AGENT 4: FAQ Generator")
-    print("="*60)
+    logger.info("\n" + "="*60)
+    logger.info(" AGENT 4: FAQ Generator")
+    logger.info("="*60)
     
     try:
         product = state.get("product")
@@ -43,48 +73,50 @@ def faq_generator_agent(state: SystemState) -> SystemState:
         
         if not product:
             error_msg = "Product not found in state"
-            print(f" {error_msg}")
+            logger.error(f" {error_msg}")
             return add_error(state, error_msg)
         
         if not questions:
             error_msg = "Questions not found in state"
-            print(f" {error_msg}")
+            logger.error(f" {error_msg}")
             return add_error(state, error_msg)
         
-        print(f" Input: {product.name} with {len(questions)} questions")
+        logger.info(f" Input: {product.name} with {len(questions)} questions")
         
        
         selected_questions = _select_best_questions(questions, max_count=10)
-        print(f" Selected {len(selected_questions)} best questions")
+        logger.info(f" Selected {len(selected_questions)} best questions")
         
        
-        qna_pairs = _generate_answers(product, selected_questions)
+        qna_pairs = await _generate_answers(product, selected_questions)
         
        
-        faq_page = FAQPageModel(
+        faq_page = FAQPageModel.from_trusted(
             product_name=product.name,
             faqs=qna_pairs,
-            generated_at=datetime.utcnow()
+            generated_at=state["generated_at"]
         )
         
         state["faq_page"] = faq_page
         
         
-        log = state.get("execution_log", [])
-        log.append(f" Agent 4 (FAQ Generator): Generated FAQ with {len(qna_pairs)} Q&A pairs")
-        state["execution_log"] = log
+        state["execution_log"].append(f" Agent 4 (FAQ Generator): Generated FAQ with {len(qna_pairs)} Q&A pairs")
         
-        print(f" Success: Generated FAQ page")
-        print(f"   Q&A Pairs: {len(qna_pairs)}")
-        print(f"   Categories: {set(q.category for q in qna_pairs)}")
+        logger.info(f" Success: Generated FAQ page")
+        logger.info(f"   Q&A Pairs: {len(qna_pairs)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("   Categories: %s", {q.category for q in qna_pairs})
         
         return state
         
     except Exception as e:
         error_msg = f"FAQ generation failed: {str(e)}"
-        print(f" {error_msg}")
+        logger.error(f" {error_msg}")
         state = add_error(state, error_msg)
         return state
+    
+    finally:
+        flush_logs()
 
 
 def _select_best_questions(
@@ -100,110 +132,88 @@ def _select_best_questions(
         return questions
     
   
-    by_category = {}
+    by_category = defaultdict(list)
     for q in questions:
-        if q.category not in by_category:
-            by_category[q.category] = []
         by_category[q.category].append(q)
     
     
-    selected = []
     per_category = max_count // len(by_category)
     
-    for category, cats_questions in by_category.items():
-        selected.extend(cats_questions[:per_category])
-    
-    return selected[:max_count]
+    return [
+        q
+        for cats_questions in by_category.values()
+        for q in cats_questions[:per_category]
+    ][:max_count]
 
 
-def _generate_answers(
+async def _generate_answers(
     product: ProductModel,
     questions: List[QuestionModel]
 ) -> List[QuestionAnswerModel]:
     """
     Generate answers for the selected questions.
+    
+    All answers come back from a single structured-output call. The
+    fallback answers are only used when that call fails or skips questions.
     """
-    llm = get_llm(temperature=0.3) 
+    llm = get_structured_llm(AnswerList, temperature=0.3)
     
     questions_text = "\n".join([
         f"{i+1}. [{q.category}] {q.question}"
         for i, q in enumerate(questions)
     ])
     
-    prompt = f"""You are a knowledgeable skincare expert. Answer these customer questions about a product.
+    prompt = FAQ_ANSWER_TEMPLATE.format_map({
+        **product.prompt_fields,
+        "questions": questions_text,
+        "question_count": len(questions),
+    })
+    
+    try:
+        response = await ainvoke_llm(llm, prompt)
+        answers = response.answers[:len(questions)]
+        
+    except Exception as e:
+        logger.warning(f" LLM answer generation failed: {e}, using fallback")
+        answers = []
+    
+    # Answers come back in question order; backfill any the LLM skipped
+    if len(answers) < len(questions):
+        if answers:
+            logger.warning(f" LLM answered {len(answers)}/{len(questions)} questions, using fallback for the rest")
+        answers.extend(
+            _fallback_qna_pair(product, question)
+            for question in questions[len(answers):]
+        )
+    
+    return answers
 
-Product Information:
-- Name: {product.name}
-- Concentration: {product.concentration}
-- Skin Types: {', '.join(product.skin_types)}
-- Key Ingredients: {', '.join(product.ingredients)}
-- Benefits: {', '.join(product.benefits)}
-- Usage: {product.usage}
-- Side Effects: {product.side_effects}
-- Price: ₹{product.price}
 
-Customer Questions:
-{questions_text}
+def _fallback_qna_pair(product: ProductModel, question: QuestionModel) -> QuestionAnswerModel:
+    """Build a Q&A pair from the fallback answer for a question."""
+    return QuestionAnswerModel(
+        question=question.question,
+        answer=_generate_fallback_answer(product, question),
+        category=question.category
+    )
 
-For EACH question, provide a helpful, accurate answer (2-4 sentences).
 
-Guidelines:
-- Be friendly and professional
-- Base answers ONLY on the product information provided
-- Don't make claims beyond what's stated
-- Be honest about side effects and limitations
-- Include practical tips where relevant
-- Keep answers concise but complete
+# Fallback answer builders keyed by question category (QuestionCategory members only)
+_FALLBACK_ANSWERS = {
+    "informational": lambda product: f"The key benefits of this product include: {product.benefits_csv}. Results vary by individual.",
+    "usage": lambda product: f"This product should be used as follows: {product.usage}. Apply consistently for best results.",
+    "safety": lambda product: f"Safety information: {product.side_effects}. Always perform a patch test before full application.",
+    "ingredients": lambda product: f"This product contains: {product.ingredients_csv}. Each ingredient has been selected for its benefits.",
+    "purchase": lambda product: f"This product is priced at ₹{product.price}, offering excellent value for its formulation.",
+    "comparison": lambda product: f"{product.name} combines {product.concentration} with {product.ingredients_csv} for {product.skin_types_csv} skin. Compare concentrations and ingredients when choosing between products.",
+}
 
-Generate answers for all {len(questions)} questions."""
-    
-    try:
-        response = llm.invoke(prompt)
-        content = response.content
-        
-       
-        qna_pairs = []
-        for question in questions:
-            answer = _generate_fallback_answer(product, question)
-            qna_pairs.append(
-                QuestionAnswerModel(
-                    question=question.question,
-                    answer=answer,
-                    category=question.category
-                )
-            )
-        
-        return qna_pairs
-        
-    except Exception as e:
-        print(f" LLM answer generation failed: {e}, using fallback")
-        qna_pairs = []
-        for question in questions:
-            answer = _generate_fallback_answer(product, question)
-            qna_pairs.append(
-                QuestionAnswerModel(
-                    question=question.question,
-                    answer=answer,
-                    category=question.category
-                )
-            )
-        return qna_pairs
+
+def _default_fallback_answer(product: ProductModel) -> str:
+    """Fallback answer for categories without a dedicated builder."""
+    return f"{product.name} is designed for {product.skin_types_csv} skin types. Please review the product information for more details."
 
 
 def _generate_fallback_answer(product: ProductModel, question: QuestionModel) -> str:
     """Generate a fallback answer based on question category and product data."""
-    
-    category = question.category.lower()
-    
-    if "usage" in category:
-        return f"This product should be used as follows: {product.usage}. Apply consistently for best results."
-    elif "safety" in category:
-        return f"Safety information: {product.side_effects}. Always perform a patch test before full application."
-    elif "ingredient" in category:
-        return f"This product contains: {', '.join(product.ingredients)}. Each ingredient has been selected for its benefits."
-    elif "price" in category or "purchase" in category:
-        return f"This product is priced at ₹{product.price}, offering excellent value for its formulation."
-    elif "benefit" in category:
-        return f"The key benefits of this product include: {', '.join(product.benefits)}. Results vary by individual."
-    else:
-        return f"{product.name} is designed for {', '.join(product.skin_types)} skin types. Please review the product information for more details."
+    return _FALLBACK_ANSWERS.get(question.category, _default_fallback_answer)(product)
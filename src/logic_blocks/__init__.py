@@ -3,14 +3,24 @@ Reusable content logic blocks.
 
 These are pure functions that transform product data into content blocks.
 They can be used by multiple agents and are easily testable.
+LLM-backed blocks also have async variants (agenerate_*), and
+generate_all_blocks builds every single-product block concurrently.
+Block results (except the creative benefit copy) are cached in-process
+per product; clear_block_caches() resets them.
 """
 
-from src.logic_blocks.benefit_block import generate_benefit_block
-from src.logic_blocks.ingredient_block import generate_ingredient_block
+from src.logic_blocks.benefit_block import generate_benefit_block, agenerate_benefit_block
+from src.logic_blocks.ingredient_block import (
+    generate_ingredient_block,
+    agenerate_ingredient_block,
+    get_ingredient_info_batch,
+)
 from src.logic_blocks.usage_block import generate_usage_block
 from src.logic_blocks.safety_block import generate_safety_block
-from src.logic_blocks.price_block import generate_price_block
-from src.logic_blocks.comparison_block import generate_comparison_block
+from src.logic_blocks.price_block import generate_price_block, generate_price_blocks_batch
+from src.logic_blocks.comparison_block import generate_comparison_block, generate_comparison_blocks_batch
+from src.logic_blocks.all_blocks import generate_all_blocks
+from src.logic_blocks._cache import clear_block_caches
 
 __all__ = [
     "generate_benefit_block",
@@ -19,4 +29,11 @@ __all__ = [
     "generate_safety_block",
     "generate_price_block",
     "generate_comparison_block",
+    "agenerate_benefit_block",
+    "agenerate_ingredient_block",
+    "generate_all_blocks",
+    "generate_price_blocks_batch",
+    "generate_comparison_blocks_batch",
+    "get_ingredient_info_batch",
+    "clear_block_caches",
 ]
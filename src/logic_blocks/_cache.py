@@ -0,0 +1,163 @@
+"""
+In-process result cache for logic blocks.
+
+Blocks are functions of the product fields, so repeated calls for the same
+product (regeneration, batch runs with duplicate products) can reuse the
+previous output instead of recomputing it or calling the LLM again.
+"""
+
+import asyncio
+import functools
+import threading
+from collections import OrderedDict
+from copy import deepcopy
+from typing import Any, Callable, Dict, Hashable, List, Tuple
+
+from src.models.product import ProductModel
+
+DEFAULT_MAXSIZE = 256
+
+# Every registered cache with the lock guarding it
+_caches: List[Tuple[Dict[Hashable, Any], threading.Lock]] = []
+
+
+class _Uncached:
+    """Block result that must be returned without being cached."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+
+def uncached(result: Any) -> Any:
+    """
+    Return a block result from a memoized block without caching it.
+
+    Used for degraded output, e.g. the fallback after a failed LLM call,
+    so a transient error is not served for the rest of the process.
+
+    Args:
+        result: Block result
+
+    Returns:
+        Marker unwrapped by memoize_block before the result is returned
+    """
+    return _Uncached(result)
+
+
+def product_key(product: ProductModel) -> str:
+    """
+    Get the canonical key for a product's field values.
+
+    The digest is computed once per product instance (see
+    ProductModel.content_key), so repeated cache lookups are cheap.
+
+    Args:
+        product: ProductModel instance
+
+    Returns:
+        Hex-encoded BLAKE2b digest of the sorted field values
+    """
+    return product.content_key
+
+
+def register_cache(cache: Dict[Hashable, Any], lock: threading.Lock) -> Dict[Hashable, Any]:
+    """
+    Have clear_block_caches() also empty a block module's own cache.
+
+    Args:
+        cache: Dict-like cache owned by a block module
+        lock: Lock held by every access to the cache
+
+    Returns:
+        The same cache, for use in an assignment
+    """
+    _caches.append((cache, lock))
+    return cache
+
+
+def _key_part(value: Any) -> Hashable:
+    return product_key(value) if isinstance(value, ProductModel) else value
+
+
+def _make_key(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Hashable:
+    return (
+        tuple(_key_part(arg) for arg in args),
+        tuple(sorted((name, _key_part(value)) for name, value in kwargs.items())),
+    )
+
+
+def memoize_block(maxsize: int = DEFAULT_MAXSIZE) -> Callable[[Callable], Callable]:
+    """
+    Cache a block generator's results, keyed on its product arguments.
+
+    ProductModel arguments are replaced by product_key() so they can be
+    hashed. Callers get a deep copy of the cached block, so mutating a
+    returned block never affects later hits. Results wrapped with
+    uncached() are returned as-is and not stored. Works for sync and
+    async generators.
+
+    Args:
+        maxsize: Maximum number of cached results (least recently used
+            entries are evicted first)
+
+    Returns:
+        Decorator for a block generator
+    """
+    def decorator(func: Callable) -> Callable:
+        cache: "OrderedDict[Hashable, Any]" = OrderedDict()
+        lock = threading.Lock()
+        register_cache(cache, lock)
+
+        def cache_clear() -> None:
+            with lock:
+                cache.clear()
+
+        def lookup(key: Hashable) -> Tuple[bool, Any]:
+            with lock:
+                if key in cache:
+                    cache.move_to_end(key)
+                    return True, deepcopy(cache[key])
+            return False, None
+
+        def store(key: Hashable, result: Any) -> Any:
+            if isinstance(result, _Uncached):
+                return result.value
+            with lock:
+                cache[key] = result
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return deepcopy(result)
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                key = _make_key(args, kwargs)
+                hit, result = lookup(key)
+                if hit:
+                    return result
+                return store(key, await func(*args, **kwargs))
+
+            async_wrapper.cache_clear = cache_clear
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = _make_key(args, kwargs)
+            hit, result = lookup(key)
+            if hit:
+                return result
+            return store(key, func(*args, **kwargs))
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
+
+
+def clear_block_caches() -> None:
+    """Empty every logic-block result cache."""
+    for cache, lock in _caches:
+        with lock:
+            cache.clear()
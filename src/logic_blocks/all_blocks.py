@@ -0,0 +1,44 @@
+"""
+Concurrent generation of all single-product content blocks.
+
+Strategy: The LLM-backed blocks (benefits, ingredients) are awaited together;
+the rule-based blocks are cheap and run inline.
+"""
+
+import asyncio
+from typing import Dict, Any
+from src.models.product import ProductModel
+from src.logic_blocks.benefit_block import agenerate_benefit_block
+from src.logic_blocks.ingredient_block import agenerate_ingredient_block
+from src.logic_blocks.usage_block import generate_usage_block
+from src.logic_blocks.safety_block import generate_safety_block
+from src.logic_blocks.price_block import generate_price_block
+
+
+async def generate_all_blocks(product: ProductModel, use_llm: bool = True) -> Dict[str, Dict[str, Any]]:
+    """
+    Generate every content block for a product.
+
+    The comparison block is not included because it needs a second product.
+
+    Args:
+        product: ProductModel instance
+        use_llm: Whether LLM-backed blocks may call the LLM
+
+    Returns:
+        Dictionary of blocks keyed by section name
+        (benefits, ingredients, usage, safety, price)
+    """
+    benefits, ingredients = await asyncio.gather(
+        agenerate_benefit_block(product, use_llm),
+        agenerate_ingredient_block(product, use_llm),
+    )
+
+    return {
+        "benefits": benefits,
+        "ingredients": ingredients,
+        # Rule-based blocks take microseconds; a worker thread would cost more
+        "usage": generate_usage_block(product),
+        "safety": generate_safety_block(product),
+        "price": generate_price_block(product),
+    }
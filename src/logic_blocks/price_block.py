@@ -4,10 +4,35 @@ Price block generator - transforms price into value proposition.
 Strategy: Add context about value, cost per use, and positioning.
 """
 
-from typing import Dict, Any
+import re
+from bisect import bisect_right
+from typing import Dict, Any, Iterable, List, Tuple
 from src.models.product import ProductModel
+from src.logic_blocks._cache import memoize_block
 
 
+# Estimated amount per application (2-3 drops at ~0.05ml per drop)
+DROPS_PER_USE = 2.5
+ML_PER_DROP = 0.05
+ML_PER_USE = DROPS_PER_USE * ML_PER_DROP
+
+# Usage text indicating two applications per day
+_TWICE_RE = re.compile(r"twice|morning\s+and\s+evening", re.IGNORECASE)
+
+# Research-backed actives worth calling out (lowercase)
+_PREMIUM_INGREDIENTS = frozenset({"vitamin c", "hyaluronic acid", "retinol", "niacinamide"})
+
+# Price positioning tiers: upper bounds (exclusive) and tier descriptions
+PRICE_TIER_BOUNDS = (500, 1000, 2000)
+PRICE_TIERS = (
+    ("Budget-Friendly", "Affordable luxury for everyday skincare"),
+    ("Mid-Range", "Premium quality at accessible pricing"),
+    ("Premium", "High-end formulation with proven ingredients"),
+    ("Luxury", "Professional-grade investment in skin health"),
+)
+
+
+@memoize_block()
 def generate_price_block(product: ProductModel, bottle_size_ml: int = 30) -> Dict[str, Any]:
     """
     Generate pricing section with value context.
@@ -22,35 +47,13 @@ def generate_price_block(product: ProductModel, bottle_size_ml: int = 30) -> Dic
     
     price = product.price
     
-    # Calculate cost per ml
-    cost_per_ml = price / bottle_size_ml
-    
-    # Calculate estimated cost per use (assuming 2-3 drops = ~0.1ml)
-    drops_per_use = 2.5  # Average of 2-3 drops
-    ml_per_use = drops_per_use * 0.05  # ~0.05ml per drop
-    cost_per_use = ml_per_use * cost_per_ml
-    
     # Calculate estimated days of use
-    uses_per_day = 1  # Default to once daily
-    if "twice" in product.usage.lower() or "morning and evening" in product.usage.lower():
-        uses_per_day = 2
+    uses_per_day = 2 if _TWICE_RE.search(product.usage) else 1
     
-    total_uses = bottle_size_ml / ml_per_use
-    days_supply = total_uses / uses_per_day
+    cost_per_ml, cost_per_use, days_supply = _price_metrics(price, uses_per_day, bottle_size_ml)
     
     # Determine price positioning
-    if price < 500:
-        positioning = "Budget-Friendly"
-        positioning_desc = "Affordable luxury for everyday skincare"
-    elif price < 1000:
-        positioning = "Mid-Range"
-        positioning_desc = "Premium quality at accessible pricing"
-    elif price < 2000:
-        positioning = "Premium"
-        positioning_desc = "High-end formulation with proven ingredients"
-    else:
-        positioning = "Luxury"
-        positioning_desc = "Professional-grade investment in skin health"
+    positioning, positioning_desc = PRICE_TIERS[bisect_right(PRICE_TIER_BOUNDS, price)]
     
     # Generate value highlights
     value_highlights = _generate_value_highlights(product, cost_per_use, days_supply)
@@ -70,6 +73,37 @@ def generate_price_block(product: ProductModel, bottle_size_ml: int = 30) -> Dic
     }
 
 
+def generate_price_blocks_batch(
+    products: Iterable[ProductModel],
+    bottle_size_ml: int = 30
+) -> List[Dict[str, Any]]:
+    """
+    Generate pricing sections for many products.
+    
+    Args:
+        products: ProductModel instances
+        bottle_size_ml: Bottle size in milliliters (default: 30ml)
+        
+    Returns:
+        List of pricing blocks, in input order
+    """
+    return [generate_price_block(product, bottle_size_ml) for product in products]
+
+
+def _price_metrics(
+    price: float,
+    uses_per_day: int,
+    bottle_size_ml: int
+) -> Tuple[float, float, float]:
+    """
+    Compute cost per ml, cost per use and days of supply.
+    """
+    cost_per_ml = price / bottle_size_ml
+    cost_per_use = ML_PER_USE * cost_per_ml
+    days_supply = bottle_size_ml / ML_PER_USE / uses_per_day
+    return cost_per_ml, cost_per_use, days_supply
+
+
 def _generate_value_highlights(
     product: ProductModel,
     cost_per_use: float,
@@ -97,8 +131,7 @@ def _generate_value_highlights(
         highlights.append(f"Effective {product.concentration} formulation")
     
     # Ingredient value
-    premium_ingredients = ["Vitamin C", "Hyaluronic Acid", "Retinol", "Niacinamide"]
-    if any(ing in product.ingredients for ing in premium_ingredients):
+    if not _PREMIUM_INGREDIENTS.isdisjoint(product.ingredients_lc):
         highlights.append("Contains premium, research-backed ingredients")
     
     # Multi-benefit value
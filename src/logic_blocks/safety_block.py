@@ -4,10 +4,74 @@ Safety block generator - transforms side effects into balanced safety informatio
 Strategy: Be honest about side effects while providing reassurance and context.
 """
 
-from typing import Dict, Any, List
+import re
+from typing import Dict, Any, FrozenSet, List
 from src.models.product import ProductModel
+from src.logic_blocks._cache import memoize_block
 
 
+# Every side-effect keyword the block reacts to, matched in one scan
+_SIDE_EFFECT_RE = re.compile("tingling|redness|dryness|irritation|sensitive")
+
+# Known side effects in display order, keyed by the keyword that triggers them
+_SIDE_EFFECT_DETAILS = (
+    ("tingling", {
+        "effect": "Tingling sensation",
+        "context": "Common with actives like Vitamin C, usually subsides after a few minutes"
+    }),
+    ("redness", {
+        "effect": "Mild redness",
+        "context": "May occur during initial use as skin adjusts - reduce frequency if severe"
+    }),
+    ("dryness", {
+        "effect": "Temporary dryness",
+        "context": "Use a good moisturizer after application to maintain skin barrier"
+    }),
+    ("irritation", {
+        "effect": "Skin irritation",
+        "context": "Discontinue use and allow skin to calm before resuming"
+    }),
+)
+
+# Fixed precautions that open and close every precaution list
+_PRECAUTIONS_HEAD = (
+    "Always patch test on inner arm 24 hours before full application",
+    "Avoid contact with eyes - if contact occurs, rinse immediately with water",
+)
+_PRECAUTIONS_TAIL = (
+    "Keep away from heat sources - store in cool place",
+    "Consult a dermatologist if you have specific skin conditions or concerns",
+)
+
+# Action steps if side effects occur, by severity
+_ACTION_STEPS_HEAD = (
+    "Stop using the product immediately",
+    "Rinse face thoroughly with cool water",
+)
+_ACTION_STEPS_STRONG = (
+    "Apply a gentle, fragrance-free moisturizer",
+    "Do not use other active ingredients until irritation clears",
+)
+_ACTION_STEPS_MILD = (
+    "Apply a calming moisturizer to soothe skin",
+)
+_ACTION_STEPS_TAIL = (
+    "Consider reintroducing at lower frequency once skin has calmed",
+)
+_STRONG_SEVERITIES = frozenset({"Moderate", "Requires Caution"})
+
+# Fixed groups who should avoid the product
+_NOT_SUITABLE_HEAD = (
+    "Pregnant or nursing women (consult doctor)",
+    "Children under 18 years",
+)
+_NOT_SUITABLE_TAIL = (
+    "Those allergic to any ingredient (review full ingredient list)",
+    "Active skin infections or severe acne (consult dermatologist first)",
+)
+
+
+@memoize_block()
 def generate_safety_block(product: ProductModel) -> Dict[str, Any]:
     """
     Generate safety and side effects section.
@@ -19,7 +83,7 @@ def generate_safety_block(product: ProductModel) -> Dict[str, Any]:
         Dictionary with structured safety content
     """
     
-    side_effects_text = product.side_effects.lower()
+    side_effects_text = product.side_effects_lc
     
     # Parse severity
     if "mild" in side_effects_text:
@@ -35,18 +99,20 @@ def generate_safety_block(product: ProductModel) -> Dict[str, Any]:
         severity = "Minimal"
         severity_description = f"{product.name} is formulated for optimal safety"
     
+    keywords = frozenset(_SIDE_EFFECT_RE.findall(side_effects_text))
+    
     # Identify specific side effects
-    known_effects = _identify_side_effects(side_effects_text)
+    known_effects = _identify_side_effects(keywords)
     
     # Generate precautions
-    precautions = _generate_precautions(product, side_effects_text)
+    precautions = _generate_precautions(product, keywords)
     
     # Generate what to do if side effects occur
     action_steps = _generate_action_steps(severity, known_effects)
     
     # Suitable for
     suitable_for = _determine_suitable_for(product)
-    not_suitable_for = _determine_not_suitable_for(product, side_effects_text)
+    not_suitable_for = _determine_not_suitable_for(product, keywords)
     
     return {
         "title": "Safety & Side Effects",
@@ -61,35 +127,15 @@ def generate_safety_block(product: ProductModel) -> Dict[str, Any]:
     }
 
 
-def _identify_side_effects(side_effects_text: str) -> List[Dict[str, str]]:
+def _identify_side_effects(keywords: FrozenSet[str]) -> List[Dict[str, str]]:
     """
     Identify and contextualize side effects.
     """
-    effects = []
-    
-    if "tingling" in side_effects_text:
-        effects.append({
-            "effect": "Tingling sensation",
-            "context": "Common with actives like Vitamin C, usually subsides after a few minutes"
-        })
-    
-    if "redness" in side_effects_text:
-        effects.append({
-            "effect": "Mild redness",
-            "context": "May occur during initial use as skin adjusts - reduce frequency if severe"
-        })
-    
-    if "dryness" in side_effects_text:
-        effects.append({
-            "effect": "Temporary dryness",
-            "context": "Use a good moisturizer after application to maintain skin barrier"
-        })
-    
-    if "irritation" in side_effects_text:
-        effects.append({
-            "effect": "Skin irritation",
-            "context": "Discontinue use and allow skin to calm before resuming"
-        })
+    effects = [
+        dict(details)
+        for keyword, details in _SIDE_EFFECT_DETAILS
+        if keyword in keywords
+    ]
     
     if not effects:
         effects.append({
@@ -100,28 +146,22 @@ def _identify_side_effects(side_effects_text: str) -> List[Dict[str, str]]:
     return effects
 
 
-def _generate_precautions(product: ProductModel, side_effects_text: str) -> List[str]:
+def _generate_precautions(product: ProductModel, keywords: FrozenSet[str]) -> List[str]:
     """
     Generate precautionary measures.
     """
-    precautions = [
-        "Always patch test on inner arm 24 hours before full application",
-        "Avoid contact with eyes - if contact occurs, rinse immediately with water"
-    ]
+    precautions = list(_PRECAUTIONS_HEAD)
     
-    if "sensitive" in side_effects_text:
+    if "sensitive" in keywords:
         precautions.append("Start with 2-3 times per week if you have sensitive skin")
     
-    if any("vitamin c" in ing.lower() for ing in product.ingredients):
+    if "vitamin_c" in product.ingredient_tags:
         precautions.append("Do not mix with vitamin B3 or niacinamide in the same routine")
     
-    if any("acid" in ing.lower() for ing in product.ingredients):
+    if "acid" in product.ingredient_tags:
         precautions.append("Avoid using with other exfoliating acids on the same day")
     
-    precautions.extend([
-        "Keep away from heat sources - store in cool place",
-        "Consult a dermatologist if you have specific skin conditions or concerns"
-    ])
+    precautions.extend(_PRECAUTIONS_TAIL)
     
     return precautions
 
@@ -130,22 +170,8 @@ def _generate_action_steps(severity: str, effects: List[Dict[str, str]]) -> List
     """
     Generate steps to take if side effects occur.
     """
-    steps = [
-        "Stop using the product immediately",
-        "Rinse face thoroughly with cool water"
-    ]
-    
-    if severity in ["Moderate", "Requires Caution"]:
-        steps.extend([
-            "Apply a gentle, fragrance-free moisturizer",
-            "Do not use other active ingredients until irritation clears"
-        ])
-    else:
-        steps.append("Apply a calming moisturizer to soothe skin")
-    
-    steps.append("Consider reintroducing at lower frequency once skin has calmed")
-    
-    return steps
+    middle = _ACTION_STEPS_STRONG if severity in _STRONG_SEVERITIES else _ACTION_STEPS_MILD
+    return [*_ACTION_STEPS_HEAD, *middle, *_ACTION_STEPS_TAIL]
 
 
 def _determine_suitable_for(product: ProductModel) -> List[str]:
@@ -159,27 +185,21 @@ def _determine_suitable_for(product: ProductModel) -> List[str]:
     
     suitable.append("Adults 18+ years")
     
-    if "mild" in product.side_effects.lower():
+    if "mild" in product.side_effects_lc:
         suitable.append("Sensitive skin types (with patch test)")
     
     return suitable
 
 
-def _determine_not_suitable_for(product: ProductModel, side_effects_text: str) -> List[str]:
+def _determine_not_suitable_for(product: ProductModel, keywords: FrozenSet[str]) -> List[str]:
     """
     Determine who should avoid the product.
     """
-    not_suitable = [
-        "Pregnant or nursing women (consult doctor)",
-        "Children under 18 years"
-    ]
+    not_suitable = list(_NOT_SUITABLE_HEAD)
     
-    if "sensitive" in side_effects_text:
+    if "sensitive" in keywords:
         not_suitable.append("Those with severe skin sensitivity without prior testing")
     
-    not_suitable.extend([
-        "Those allergic to any ingredient (review full ingredient list)",
-        "Active skin infections or severe acne (consult dermatologist first)"
-    ])
+    not_suitable.extend(_NOT_SUITABLE_TAIL)
     
     return not_suitable
@@ -4,10 +4,59 @@ Usage block generator - transforms usage instructions into step-by-step guide.
 Strategy: Add context about routine timing and application tips.
 """
 
-from typing import Dict, Any, List
-from src.models.product import ProductModel
+import re
+from typing import Dict, Any, FrozenSet, List
+from src.models.product import SKIN_OILY, SKIN_SENSITIVE, ProductModel
+from src.logic_blocks._cache import memoize_block
 
 
+# Every usage keyword the block reacts to, matched in one scan of the
+# lowercased text. Longer phrases come first so they win over their parts.
+_USAGE_RE = re.compile(
+    "morning and evening|2[-–]3 drops|pea-sized|morning|evening|night|drop|once|twice"
+)
+
+# Flags implied by phrases that contain other keywords; any other match
+# is its own flag
+_USAGE_PHRASE_FLAGS = {
+    "morning and evening": ("morning", "evening", "twice"),
+    "2-3 drops": ("2-3 drops", "drop"),
+    "2–3 drops": ("2-3 drops", "drop"),
+}
+
+
+# Application steps shared by every product; step 2 depends on the amount.
+# Results are deep-copied by memoize_block, so callers never see these dicts.
+_STEP_CLEANSE = {
+    "step": 1,
+    "action": "Cleanse",
+    "description": "Start with a clean face and neck. Pat dry completely."
+}
+_STEPS_AFTER_APPLY = (
+    {
+        "step": 3,
+        "action": "Massage",
+        "description": "Gently massage in upward, circular motions for 30 seconds."
+    },
+    {
+        "step": 4,
+        "action": "Wait",
+        "description": "Allow serum to absorb for 1-2 minutes before proceeding."
+    },
+)
+_STEP_SUNSCREEN = {
+    "step": 5,
+    "action": "Apply Sunscreen",
+    "description": "Always apply broad-spectrum SPF 30+ sunscreen as the final step."
+}
+_STEP_MOISTURIZE = {
+    "step": 5,
+    "action": "Moisturize",
+    "description": "Follow with your regular moisturizer to lock in benefits."
+}
+
+
+@memoize_block()
 def generate_usage_block(product: ProductModel) -> Dict[str, Any]:
     """
     Generate usage instructions with context.
@@ -20,13 +69,13 @@ def generate_usage_block(product: ProductModel) -> Dict[str, Any]:
     """
     
     # Parse the usage instruction
-    usage_text = product.usage.lower()
+    flags = _usage_flags(product.usage)
     
     # Determine timing
-    if "morning" in usage_text:
+    if "morning" in flags:
         timing = "Morning"
         routine_position = "after cleansing, before sunscreen"
-    elif "evening" in usage_text or "night" in usage_text:
+    elif "evening" in flags or "night" in flags:
         timing = "Evening"
         routine_position = "after cleansing, before moisturizer"
     else:
@@ -34,11 +83,11 @@ def generate_usage_block(product: ProductModel) -> Dict[str, Any]:
         routine_position = "as needed in your skincare routine"
     
     # Extract application amount
-    if "2-3 drops" in usage_text or "2–3 drops" in usage_text:
+    if "2-3 drops" in flags:
         application_amount = "2-3 drops"
-    elif "drop" in usage_text:
+    elif "drop" in flags:
         application_amount = "Few drops"
-    elif "pea-sized" in usage_text:
+    elif "pea-sized" in flags:
         application_amount = "Pea-sized amount"
     else:
         application_amount = "As directed"
@@ -51,7 +100,7 @@ def generate_usage_block(product: ProductModel) -> Dict[str, Any]:
     
     return {
         "title": "How to Use",
-        "frequency": _determine_frequency(usage_text),
+        "frequency": _determine_frequency(flags),
         "timing": timing,
         "routine_position": routine_position,
         "application_amount": application_amount,
@@ -61,6 +110,17 @@ def generate_usage_block(product: ProductModel) -> Dict[str, Any]:
     }
 
 
+def _usage_flags(usage: str) -> FrozenSet[str]:
+    """
+    Collect the usage keywords present in the usage text.
+    """
+    return frozenset(
+        flag
+        for match in _USAGE_RE.findall(usage.lower())
+        for flag in _USAGE_PHRASE_FLAGS.get(match, (match,))
+    )
+
+
 def _generate_application_steps(
     product: ProductModel,
     amount: str,
@@ -69,44 +129,16 @@ def _generate_application_steps(
     """
     Generate step-by-step application instructions.
     """
-    steps = [
-        {
-            "step": 1,
-            "action": "Cleanse",
-            "description": "Start with a clean face and neck. Pat dry completely."
-        },
-        {
-            "step": 2,
-            "action": "Apply Serum",
-            "description": f"Dispense {amount} onto fingertips and apply to face and neck."
-        },
-        {
-            "step": 3,
-            "action": "Massage",
-            "description": "Gently massage in upward, circular motions for 30 seconds."
-        },
-        {
-            "step": 4,
-            "action": "Wait",
-            "description": "Allow serum to absorb for 1-2 minutes before proceeding."
-        }
-    ]
+    apply_step = {
+        "step": 2,
+        "action": "Apply Serum",
+        "description": f"Dispense {amount} onto fingertips and apply to face and neck."
+    }
     
     # Add timing-specific step
-    if "morning" in timing.lower():
-        steps.append({
-            "step": 5,
-            "action": "Apply Sunscreen",
-            "description": "Always apply broad-spectrum SPF 30+ sunscreen as the final step."
-        })
-    else:
-        steps.append({
-            "step": 5,
-            "action": "Moisturize",
-            "description": "Follow with your regular moisturizer to lock in benefits."
-        })
+    final_step = _STEP_SUNSCREEN if "morning" in timing.lower() else _STEP_MOISTURIZE
     
-    return steps
+    return [_STEP_CLEANSE, apply_step, *_STEPS_AFTER_APPLY, final_step]
 
 
 def _generate_usage_tips(product: ProductModel) -> List[str]:
@@ -116,15 +148,15 @@ def _generate_usage_tips(product: ProductModel) -> List[str]:
     tips = []
     
     # Vitamin C specific tips
-    if any("vitamin c" in ing.lower() for ing in product.ingredients):
+    if "vitamin_c" in product.ingredient_tags:
         tips.append("Vitamin C works best on clean skin - apply to completely dry face")
         tips.append("Store in a cool place to maintain stability and potency")
     
     # Skin type specific tips
-    if "Oily" in product.skin_types:
+    if SKIN_OILY in product.skin_types:
         tips.append("Use lightweight moisturizer after application")
     
-    if "Sensitive" in product.skin_types or "sensitive" in product.side_effects.lower():
+    if SKIN_SENSITIVE in product.skin_types or "sensitive" in product.side_effects_lc:
         tips.append("Start with use 2-3 times per week to allow skin to adapt")
         tips.append("Do patch test on inner arm first if this is your first time")
     
@@ -135,17 +167,17 @@ def _generate_usage_tips(product: ProductModel) -> List[str]:
     return tips
 
 
-def _determine_frequency(usage_text: str) -> str:
+def _determine_frequency(flags: FrozenSet[str]) -> str:
     """
-    Determine usage frequency from usage text.
+    Determine usage frequency from the usage keywords.
     """
-    if "once" in usage_text:
+    if "once" in flags:
         return "Once daily"
-    elif "twice" in usage_text or "morning and evening" in usage_text:
+    elif "twice" in flags:
         return "Twice daily"
-    elif "morning" in usage_text:
+    elif "morning" in flags:
         return "Once daily (morning)"
-    elif "evening" in usage_text or "night" in usage_text:
+    elif "evening" in flags or "night" in flags:
         return "Once daily (evening)"
     else:
         return "Daily"
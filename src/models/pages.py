@@ -2,50 +2,141 @@
 Page output models - the final JSON structures for each page type.
 """
 
-from datetime import datetime
-from typing import List, Dict, Literal, Any
-from pydantic import BaseModel, Field
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Annotated, Iterator, List, Dict, Literal, Any, Optional
+from pydantic import BaseModel, ConfigDict, Field
 
 from src.models.question import QuestionAnswerModel
 from src.models.product import ProductModel
 
 
-class FAQPageModel(BaseModel):
+# Timestamp shared by every page generated within one workflow run
+_generation_time: ContextVar[Optional[datetime]] = ContextVar("generation_time", default=None)
+
+
+@contextmanager
+def generation_time(timestamp: datetime) -> Iterator[datetime]:
+    """
+    Use one timestamp as the default generated_at for pages built inside the block.
+    
+    The value is held in a context variable, so concurrent workflows
+    (and the tasks they spawn) each see their own timestamp.
+    
+    Args:
+        timestamp: Timezone-aware generation time
+        
+    Yields:
+        The timestamp
+    """
+    token = _generation_time.set(timestamp)
+    try:
+        yield timestamp
+    finally:
+        _generation_time.reset(token)
+
+
+def _utcnow() -> datetime:
+    """Current workflow timestamp, or the current UTC time outside a workflow."""
+    timestamp = _generation_time.get()
+    return timestamp if timestamp is not None else datetime.now(timezone.utc)
+
+
+# Generation timestamp field shared by every page model. Declared per model
+# (rather than on the base class) so it stays the last field in the output.
+GeneratedAt = Annotated[datetime, Field(
+    default_factory=_utcnow,
+    description="Timestamp of generation"
+)]
+
+
+class _PageBase(BaseModel):
+    """Common behaviour for page output models."""
+    
+    @classmethod
+    def from_trusted(cls, **data: Any) -> "_PageBase":
+        """
+        Build the page without validation.
+        
+        Only for data built in-process, e.g. Q&A pairs that are already
+        QuestionAnswerModel instances or sections from the logic_blocks
+        generators. Externally supplied data must go through the
+        validating constructor.
+        
+        Args:
+            **data: Field values
+            
+        Returns:
+            Page instance (defaults such as generated_at still apply)
+        """
+        return cls.model_construct(**data)
+
+
+_FAQ_EXAMPLE = {
+    "example": {
+        "page_type": "faq",
+        "product_name": "GlowBoost Vitamin C Serum",
+        "faqs": [
+            {
+                "question": "How do I use this serum?",
+                "answer": "Apply 2-3 drops to clean skin in the morning...",
+                "category": "usage"
+            }
+        ],
+        "generated_at": "2024-01-15T10:30:00"
+    }
+}
+
+_PRODUCT_EXAMPLE = {
+    "example": {
+        "page_type": "product",
+        "product_name": "GlowBoost Vitamin C Serum",
+        "hero_section": {
+            "headline": "Radiant Skin in a Drop",
+            "tagline": "Professional-grade vitamin C serum for visible brightening"
+        },
+        "benefits_section": {},
+        "usage_section": {},
+        "ingredients_section": {},
+        "safety_section": {},
+        "price_section": {}
+    }
+}
+
+_COMPARISON_EXAMPLE = {
+    "example": {
+        "page_type": "comparison",
+        "product_a": {},
+        "product_b": {},
+        "comparison_matrix": [],
+        "recommendation": "Both products offer excellent vitamin C delivery..."
+    }
+}
+
+
+class FAQPageModel(_PageBase):
     """
     FAQ page output structure.
     """
     
+    model_config = ConfigDict(json_schema_extra=_FAQ_EXAMPLE)
+    
     page_type: Literal["faq"] = "faq"
     product_name: str = Field(..., description="Product name for this FAQ")
     faqs: List[QuestionAnswerModel] = Field(
         ..., description="List of question-answer pairs"
     )
-    generated_at: datetime = Field(
-        default_factory=datetime.utcnow,
-        description="Timestamp of generation"
-    )
-    
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "page_type": "faq",
-                "product_name": "GlowBoost Vitamin C Serum",
-                "faqs": [
-                    {
-                        "question": "How do I use this serum?",
-                        "answer": "Apply 2-3 drops to clean skin in the morning...",
-                        "category": "usage"
-                    }
-                ],
-                "generated_at": "2024-01-15T10:30:00"
-            }
-        }
+    generated_at: GeneratedAt
 
-class ProductPageModel(BaseModel):
+
+class ProductPageModel(_PageBase):
     """
     Product description page output structure.
     """
     
+    model_config = ConfigDict(json_schema_extra=_PRODUCT_EXAMPLE)
+    
     page_type: Literal["product"] = "product"
     product_name: str = Field(..., description="Product name")
     
@@ -73,33 +164,16 @@ class ProductPageModel(BaseModel):
         ..., description="Pricing and value proposition"
     )
     
-    generated_at: datetime = Field(
-        default_factory=datetime.utcnow,
-        description="Timestamp of generation"
-    )
-    
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "page_type": "product",
-                "product_name": "GlowBoost Vitamin C Serum",
-                "hero_section": {
-                    "headline": "Radiant Skin in a Drop",
-                    "tagline": "Professional-grade vitamin C serum for visible brightening"
-                },
-                "benefits_section": {},
-                "usage_section": {},
-                "ingredients_section": {},
-                "safety_section": {},
-                "price_section": {}
-            }
-        }
+    generated_at: GeneratedAt
+
 
-class ComparisonPageModel(BaseModel):
+class ComparisonPageModel(_PageBase):
     """
     Comparison page output structure.
     """
     
+    model_config = ConfigDict(json_schema_extra=_COMPARISON_EXAMPLE)
+    
     page_type: Literal["comparison"] = "comparison"
     product_a: ProductModel = Field(..., description="Original product")
     product_b: ProductModel = Field(..., description="Comparison product (fictional)")
@@ -112,18 +186,4 @@ class ComparisonPageModel(BaseModel):
         ..., min_length=50, description="Objective recommendation for users"
     )
     
-    generated_at: datetime = Field(
-        default_factory=datetime.utcnow,
-        description="Timestamp of generation"
-    )
-    
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "page_type": "comparison",
-                "product_a": {},
-                "product_b": {},
-                "comparison_matrix": [],
-                "recommendation": "Both products offer excellent vitamin C delivery..."
-            }
-        }
+    generated_at: GeneratedAt
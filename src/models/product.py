@@ -2,8 +2,25 @@
 Product data model - the core data structure for all agents.
 """
 
-from typing import List
-from pydantic import BaseModel, Field, field_validator
+import hashlib
+import re
+import sys
+from functools import cached_property
+from typing import Any, Dict, FrozenSet, List, Tuple
+import orjson
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+
+# Skin types the logic blocks check for. Validated products intern their
+# skin types, so membership tests against these compare by identity first.
+SKIN_OILY = sys.intern("Oily")
+SKIN_SENSITIVE = sys.intern("Sensitive")
+
+# Ingredient keywords the logic blocks react to; a match becomes a tag
+# with spaces replaced by underscores (e.g. "vitamin c" -> "vitamin_c")
+_INGREDIENT_TAG_RE = re.compile(
+    "vitamin c|niacinamide|retinol|hyaluronic|salicylic|glycolic|lactic|acid"
+)
 
 
 class ProductModel(BaseModel):
@@ -12,8 +29,28 @@ class ProductModel(BaseModel):
     
     This is the single source of truth for product information.
     All agents consume this model.
+    
+    Instances are frozen: agents only read product data, and the
+    cached comma-joined fields stay in sync with the lists.
     """
     
+    model_config = ConfigDict(
+        frozen=True,
+        validate_assignment=False,
+        json_schema_extra={
+            "example": {
+                "name": "GlowBoost Vitamin C Serum",
+                "concentration": "10% Vitamin C",
+                "skin_types": ["Oily", "Combination"],
+                "ingredients": ["Vitamin C", "Hyaluronic Acid"],
+                "benefits": ["Brightening", "Fades dark spots"],
+                "usage": "Apply 2–3 drops in the morning before sunscreen",
+                "side_effects": "Mild tingling for sensitive skin",
+                "price": 699
+            }
+        }
+    )
+    
     name: str = Field(..., description="Product name")
     concentration: str = Field(..., description="Active ingredient concentration")
     skin_types: List[str] = Field(..., description="Suitable skin types")
@@ -30,6 +67,12 @@ class ProductModel(BaseModel):
             raise ValueError("List cannot be empty")
         return v
     
+    @field_validator('skin_types')
+    @classmethod
+    def intern_skin_types(cls, v: List[str]) -> List[str]:
+        # A handful of skin types repeat across every product
+        return [sys.intern(skin_type) for skin_type in v]
+    
     @field_validator('name', 'concentration', 'usage', 'side_effects')
     @classmethod
     def validate_non_empty_string(cls, v: str) -> str:
@@ -37,16 +80,67 @@ class ProductModel(BaseModel):
             raise ValueError("String cannot be empty")
         return v.strip()
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "name": "GlowBoost Vitamin C Serum",
-                "concentration": "10% Vitamin C",
-                "skin_types": ["Oily", "Combination"],
-                "ingredients": ["Vitamin C", "Hyaluronic Acid"],
-                "benefits": ["Brightening", "Fades dark spots"],
-                "usage": "Apply 2–3 drops in the morning before sunscreen",
-                "side_effects": "Mild tingling for sensitive skin",
-                "price": 699
-            }
+    @cached_property
+    def content_key(self) -> str:
+        """
+        Canonical digest of the field values (computed once).
+        
+        Equal products share the same key, so it can be used to key caches.
+        """
+        payload = orjson.dumps(self.model_dump(), option=orjson.OPT_SORT_KEYS)
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+    
+    def __hash__(self) -> int:
+        # The list fields are not hashable, so hash the content digest
+        return hash(self.content_key)
+    
+    @cached_property
+    def skin_types_csv(self) -> str:
+        """Skin types as a comma-separated string (computed once)."""
+        return ", ".join(self.skin_types)
+    
+    @cached_property
+    def ingredients_csv(self) -> str:
+        """Ingredients as a comma-separated string (computed once)."""
+        return ", ".join(self.ingredients)
+    
+    @cached_property
+    def benefits_csv(self) -> str:
+        """Benefits as a comma-separated string (computed once)."""
+        return ", ".join(self.benefits)
+    
+    @cached_property
+    def side_effects_lc(self) -> str:
+        """Side effects text in lowercase (computed once)."""
+        return self.side_effects.lower()
+    
+    @cached_property
+    def ingredients_lc(self) -> Tuple[str, ...]:
+        """Ingredient names in lowercase, in input order (computed once)."""
+        return tuple(ingredient.lower() for ingredient in self.ingredients)
+    
+    @cached_property
+    def ingredient_tags(self) -> FrozenSet[str]:
+        """
+        Normalized tags for notable ingredients (computed once).
+        
+        Any ingredient containing "acid" also yields the generic "acid" tag.
+        """
+        text = "\n".join(self.ingredients_lc)
+        return frozenset(
+            match.replace(" ", "_") for match in _INGREDIENT_TAG_RE.findall(text)
+        )
+    
+    @cached_property
+    def prompt_fields(self) -> Dict[str, Any]:
+        """Fields for prompt templates via str.format_map (computed once)."""
+        return {
+            "name": self.name,
+            "concentration": self.concentration,
+            "skin_types": self.skin_types_csv,
+            "ingredients": self.ingredients_csv,
+            "benefits": self.benefits_csv,
+            "usage": self.usage,
+            "side_effects": self.side_effects,
+            "price": self.price,
         }
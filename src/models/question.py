@@ -2,8 +2,20 @@
 Question and Q&A models for content generation.
 """
 
+import sys
 from typing import Literal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+
+# Categories a generated question can have
+QuestionCategory = Literal[
+    "informational",
+    "safety",
+    "usage",
+    "purchase",
+    "comparison",
+    "ingredients"
+]
 
 
 class QuestionModel(BaseModel):
@@ -11,39 +23,43 @@ class QuestionModel(BaseModel):
     A categorized user question about the product.
     """
     
-    category: Literal[
-        "informational",
-        "safety",
-        "usage",
-        "purchase",
-        "comparison",
-        "ingredients"
-    ] = Field(..., description="Question category")
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "category": "safety",
+            "question": "Is this product safe for sensitive skin?"
+        }
+    })
+    
+    category: QuestionCategory = Field(..., description="Question category")
     
     question: str = Field(..., min_length=10, description="The question text")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "category": "safety",
-                "question": "Is this product safe for sensitive skin?"
-            }
-        }
+    @field_validator("category")
+    @classmethod
+    def intern_category(cls, v: str) -> str:
+        # Categories come from a small fixed set, so share one object each
+        return sys.intern(v)
+
 
 class QuestionAnswerModel(BaseModel):
     """
     A question with its generated answer (for FAQ pages).
     """
     
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "question": "Is this product safe for sensitive skin?",
+            "answer": "While this product is generally well-tolerated, sensitive skin individuals may experience mild tingling. Start with lower frequency and monitor your skin's response.",
+            "category": "safety"
+        }
+    })
+    
     question: str = Field(..., description="The question text")
     answer: str = Field(..., min_length=20, description="The answer text")
     category: str = Field(..., description="Question category")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "question": "Is this product safe for sensitive skin?",
-                "answer": "While this product is generally well-tolerated, sensitive skin individuals may experience mild tingling. Start with lower frequency and monitor your skin's response.",
-                "category": "safety"
-            }
-        }
+    @field_validator("category")
+    @classmethod
+    def intern_category(cls, v: str) -> str:
+        # Categories come from a small fixed set, so share one object each
+        return sys.intern(v)
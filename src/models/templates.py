@@ -2,28 +2,50 @@
 Template definition models for declarative page generation.
 """
 
-from typing import List, Dict, Any
-from pydantic import BaseModel, Field
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Tuple
+from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
+
+# Shared read-only default for sections without format rules
+_NO_FORMAT_RULES: Mapping[str, Any] = MappingProxyType({})
 
 
 class TemplateSection(BaseModel):
     """
     A single section within a template.
+    
+    Sections are frozen and store block names as tuples and format rules
+    as read-only mappings, so a template can be built once and shared
+    without defensive copies.
     """
     
+    model_config = ConfigDict(frozen=True)
+    
     section_name: str = Field(..., description="Name of the section")
-    required_blocks: List[str] = Field(
-        default=[], description="Required logic blocks for this section"
+    required_blocks: Tuple[str, ...] = Field(
+        default=(), description="Required logic blocks for this section"
     )
-    optional_blocks: List[str] = Field(
-        default=[], description="Optional logic blocks for this section"
+    optional_blocks: Tuple[str, ...] = Field(
+        default=(), description="Optional logic blocks for this section"
     )
     llm_enhance: bool = Field(
         default=False, description="Whether to enhance with LLM"
     )
-    format_rules: Dict[str, Any] = Field(
-        default={}, description="Format rules for output"
+    format_rules: Mapping[str, Any] = Field(
+        # A factory, because Pydantic deep-copies plain defaults and a
+        # mappingproxy cannot be copied
+        default_factory=lambda: _NO_FORMAT_RULES, description="Format rules for output"
     )
+    
+    @field_validator("format_rules")
+    @classmethod
+    def freeze_format_rules(cls, v: Mapping[str, Any]) -> Mapping[str, Any]:
+        # Read-only view, so a shared template cannot be mutated in place
+        return MappingProxyType(dict(v))
+    
+    @field_serializer("format_rules")
+    def serialize_format_rules(self, v: Mapping[str, Any]) -> Dict[str, Any]:
+        return dict(v)
 
 
 class TemplateModel(BaseModel):
@@ -31,11 +53,9 @@ class TemplateModel(BaseModel):
     A complete page template definition.
     """
     
-    template_type: str = Field(..., description="Type of template (faq, product, comparison)")
-    sections: List[TemplateSection] = Field(..., description="List of sections in this template")
-    
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "template_type": "product",
                 "sections": [
@@ -49,3 +69,7 @@ class TemplateModel(BaseModel):
                 ]
             }
         }
+    )
+    
+    template_type: str = Field(..., description="Type of template (faq, product, comparison)")
+    sections: Tuple[TemplateSection, ...] = Field(..., description="Sections in this template, in order")
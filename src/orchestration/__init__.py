@@ -5,9 +5,15 @@ Manages the multi-agent workflow using a directed acyclic graph (DAG).
 """
 
 from src.orchestration.state import SystemState
-from src.orchestration.graph import create_workflow_graph
+from src.orchestration.graph import (
+    create_workflow_graph,
+    get_compiled_workflow,
+    reset_compiled_workflow,
+)
 
 __all__ = [
     "SystemState",
     "create_workflow_graph",
+    "get_compiled_workflow",
+    "reset_compiled_workflow",
 ]
@@ -2,81 +2,79 @@
 Execution utilities for the workflow.
 
 Workflow Execution:
-- Sequential execution: parse_data → questions → faq → product → comparison
-- This avoids LangGraph concurrent update errors on immutable state fields
-- Each agent modifies different fields, no conflicts
+- Sequential execution: parse_data → questions
+- Fan-out: faq, product and comparison pages are generated concurrently
+- Each page agent works on its own copy of the state; results and logs
+  are merged at the fan-in point, so there are no conflicts
 - Total execution time: ~30-60 seconds depending on LLM latency
+- LLM-backed agents are coroutines, so the graph is run with `ainvoke`
 """
 
 from typing import Dict, Any
-from src.orchestration.graph import create_workflow_graph
+from src.models.pages import generation_time
+from src.orchestration.graph import get_compiled_workflow
 from src.orchestration.state import SystemState, create_initial_state, get_state_summary
 
 
-def execute_workflow(raw_data: Dict[str, Any]) -> SystemState:
+async def execute_workflow(raw_data: Dict[str, Any], trusted: bool = False) -> SystemState:
     """
-    Execute the complete workflow sequentially.
+    Execute the complete workflow.
     
     Args:
         raw_data: Raw product data dictionary
+        trusted: Skip product validation for pre-validated input
         
     Returns:
         Final system state with all generated content
     """
     # Create initial state
-    state = create_initial_state(raw_data)
-    
-    # Create and execute workflow
-    workflow = create_workflow_graph()
-    compiled_workflow = workflow.compile()
+    state = create_initial_state(raw_data, trusted)
     
-    # Run workflow
-    final_state = compiled_workflow.invoke(state)
+    # Run workflow; pages default to the state's timestamp
+    with generation_time(state["generated_at"]):
+        final_state = await get_compiled_workflow().ainvoke(state)
     
     return final_state
 
 
-def execute_workflow_step_by_step(raw_data: Dict[str, Any]) -> Dict[str, SystemState]:
+# Stages reported by execute_workflow_step_by_step, keyed by graph node:
+# stage name and the state keys that node produces
+STAGES = {
+    "parse_data": ("after_parser", ("product",)),
+    "generate_questions": ("after_questions", ("questions",)),
+    "generate_pages": ("after_pages", ("faq_page", "product_page", "comparison_page")),
+}
+
+
+async def execute_workflow_step_by_step(raw_data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
     """
-    Execute workflow with detailed state at each step.
+    Execute workflow with detailed output at each step.
+    
+    The graph is run once and streamed. Each stage records only what its
+    node produced plus the errors so far, instead of a copy of the whole
+    state. The page agents fan out inside a single node, so their pages
+    appear together under "after_pages".
     
     Args:
         raw_data: Raw product data
         
     Returns:
-        Dictionary with state after each agent
+        Dictionary mapping each stage name to its outputs and errors,
+        plus "final_state" with the complete state
     """
-    from src.agents import (
-        data_parser_agent,
-        question_generator_agent,
-        faq_generator_agent,
-        product_page_generator_agent,
-        comparison_generator_agent
-    )
-    
     states = {}
-    
-    # Step 1: Parse data
     state = create_initial_state(raw_data)
-    state = data_parser_agent(state)
-    states["after_parser"] = state.copy()
-    
-    # Step 2: Generate questions
-    state = question_generator_agent(state)
-    states["after_questions"] = state.copy()
-    
-    # Step 3: Generate FAQ
-    state = faq_generator_agent(state)
-    states["after_faq"] = state.copy()
-    
-    # Step 4: Generate product page
-    state = product_page_generator_agent(state)
-    states["after_product"] = state.copy()
     
-    # Step 5: Generate comparison
-    state = comparison_generator_agent(state)
-    states["after_comparison"] = state.copy()
+    with generation_time(state["generated_at"]):
+        async for update in get_compiled_workflow().astream(state, stream_mode="updates"):
+            for node, node_state in update.items():
+                stage, output_keys = STAGES.get(node, (node, ()))
+                snapshot = {key: node_state[key] for key in output_keys if key in node_state}
+                snapshot["errors"] = list(node_state["errors"])
+                states[stage] = snapshot
+                state = node_state
     
+    states["final_state"] = state
     return states
 
 
@@ -101,7 +99,7 @@ def validate_workflow_output(state: SystemState) -> Dict[str, Any]:
     validation = {
         "all_required_outputs_present": True,
         "missing_outputs": [],
-        "errors": state.get("errors", []),
+        "errors": state["errors"],
         "state_summary": get_state_summary(state)
     }
     
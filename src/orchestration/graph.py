@@ -4,9 +4,13 @@ LangGraph workflow definition.
 Defines the DAG (Directed Acyclic Graph) for agent orchestration.
 """
 
-from typing import Literal
+import asyncio
+from collections import deque
+from functools import lru_cache
+from typing import Any, Callable, Literal
 from langgraph.graph import StateGraph, END
 from src.orchestration.state import SystemState
+from src.utils.logger import logger
 
 
 def create_workflow_graph() -> StateGraph:
@@ -16,11 +20,12 @@ def create_workflow_graph() -> StateGraph:
     Workflow:
     1. Parse data (Agent 1)
     2. Generate questions (Agent 2)
-    3. Generate FAQ (Agent 4)
-    4. Generate Product page (Agent 5)
-    5. Generate Comparison (Agent 6)
+    3. Fan out: FAQ (Agent 4), Product page (Agent 5) and
+       Comparison (Agent 6) run concurrently
+    4. Fan in: page results are merged back into the state
     
-    Note: Sequential execution avoids LangGraph concurrent update errors
+    Note: The fan-out happens inside a single node so LangGraph never
+    sees concurrent updates to the same state keys
     """
     
     workflow = StateGraph(SystemState)
@@ -28,20 +33,15 @@ def create_workflow_graph() -> StateGraph:
     # Import agents
     from src.agents import (
         data_parser_agent,
-        question_generator_agent,
-        faq_generator_agent,
-        product_page_generator_agent,
-        comparison_generator_agent
+        question_generator_agent
     )
     
     # Add nodes
     workflow.add_node("parse_data", data_parser_agent)
     workflow.add_node("generate_questions", question_generator_agent)
-    workflow.add_node("generate_faq", faq_generator_agent)
-    workflow.add_node("generate_product_page", product_page_generator_agent)
-    workflow.add_node("generate_comparison", comparison_generator_agent)
+    workflow.add_node("generate_pages", generate_pages)
     
-    # Sequential execution to avoid concurrent state updates
+    # Parsing and questions must run first - every page depends on them
     workflow.add_edge("parse_data", "generate_questions")
     
     # Check for errors before continuing
@@ -49,15 +49,13 @@ def create_workflow_graph() -> StateGraph:
         "generate_questions",
         should_continue_after_questions,
         {
-            "continue": "generate_faq",
+            "continue": "generate_pages",
             "error": END
         }
     )
     
-    # Sequential generation of pages (prevents concurrent updates)
-    workflow.add_edge("generate_faq", "generate_product_page")
-    workflow.add_edge("generate_product_page", "generate_comparison")
-    workflow.add_edge("generate_comparison", END)
+    # Pages fan in here before the workflow ends
+    workflow.add_edge("generate_pages", END)
     
     # Set entry point
     workflow.set_entry_point("parse_data")
@@ -65,6 +63,25 @@ def create_workflow_graph() -> StateGraph:
     return workflow
 
 
+@lru_cache(maxsize=1)
+def get_compiled_workflow():
+    """
+    Get the compiled workflow graph, compiling it on first use.
+    
+    The graph depends only on code, so it is compiled once per process
+    and shared by every run.
+    
+    Returns:
+        Compiled LangGraph workflow
+    """
+    return create_workflow_graph().compile()
+
+
+def reset_compiled_workflow() -> None:
+    """Drop the cached compiled workflow so the next run recompiles it."""
+    get_compiled_workflow.cache_clear()
+
+
 def should_continue_after_questions(
     state: SystemState
 ) -> Literal["continue", "error"]:
@@ -77,26 +94,84 @@ def should_continue_after_questions(
     Returns:
         "continue" if successful, "error" if there are errors
     """
-    errors = state.get("errors", [])
+    errors = state["errors"]
     
-    if len(errors) > 0:
-        print(f" Errors detected: {errors}")
+    if errors:
+        logger.warning(" Errors detected: %s", errors)
         return "error"
     
     if "questions" not in state:
-        error_msg = "No questions were generated"
-        state["errors"] = state.get("errors", []) + [error_msg]
+        errors.append("No questions were generated")
         return "error"
     
     return "continue"
 
 
+async def generate_pages(state: SystemState) -> SystemState:
+    """
+    Fan out the page agents (4, 5, 6) and fan their results back in.
+    
+    All three agents depend only on the product (and questions for the
+    FAQ), so they run concurrently. Each branch works on its own shallow
+    copy of the state with private `errors` and `execution_log` lists,
+    which are merged back in a fixed order once every branch finishes.
+    
+    Args:
+        state: System state with product and questions
+        
+    Returns:
+        Updated state with faq_page, product_page and comparison_page
+    """
+    from src.agents import (
+        faq_generator_agent,
+        product_page_generator_agent,
+        comparison_generator_agent
+    )
+    
+    page_agents = [
+        ("faq_page", faq_generator_agent),
+        ("product_page", product_page_generator_agent),
+        ("comparison_page", comparison_generator_agent),
+    ]
+    
+    branches = await asyncio.gather(*(
+        _run_page_agent(agent, _branch_state(state))
+        for _, agent in page_agents
+    ))
+    
+    for (output_key, _), branch in zip(page_agents, branches):
+        if output_key in branch:
+            state[output_key] = branch[output_key]
+        state["errors"].extend(branch["errors"])
+        state["execution_log"].extend(branch["execution_log"])
+    
+    return state
+
+
+def _branch_state(state: SystemState) -> SystemState:
+    """Create an isolated copy of the state for one fan-out branch."""
+    branch = dict(state)
+    branch["errors"] = []
+    branch["execution_log"] = deque()
+    return branch
+
+
+async def _run_page_agent(
+    agent: Callable[[SystemState], Any],
+    state: SystemState
+) -> SystemState:
+    """Run a page agent, offloading synchronous agents to a worker thread."""
+    if asyncio.iscoroutinefunction(agent):
+        return await agent(state)
+    return await asyncio.to_thread(agent, state)
+
+
 def create_parallel_workflow_graph() -> StateGraph:
     """
-    Create an alternative workflow with more parallelization.
+    Create the workflow with parallel page generation.
     
-    Note: This is a future extension - keeping sequential for now
-    to ensure dependencies are met.
+    Note: The main workflow already fans out the page agents, so this
+    is kept as an alias for backwards compatibility.
     """
     return create_workflow_graph()
 
@@ -132,11 +207,9 @@ def get_workflow_info(workflow: StateGraph) -> dict:
         "nodes": [
             "parse_data",
             "generate_questions",
-            "generate_faq",
-            "generate_product_page",
-            "generate_comparison"
+            "generate_pages"
         ],
-        "flow": "Sequential parsing → Parallel generation",
+        "flow": "Sequential parsing → Parallel generation (FAQ, product, comparison)",
         "error_handling": "Stops at question generation if errors occur"
     }
 
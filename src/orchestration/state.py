@@ -5,21 +5,37 @@ This is the shared state that flows through all agents.
 Each agent reads from and writes to this state.
 """
 
-from typing import TypedDict, Optional, List
+from collections import deque
+from datetime import datetime, timezone
+from typing import Deque, TypedDict, Optional, List, Required
 from src.models.product import ProductModel
 from src.models.question import QuestionModel
 from src.models.pages import FAQPageModel, ProductPageModel, ComparisonPageModel
 
 
+# Generated outputs reported by get_state_summary, by summary field
+_SUMMARY_OUTPUTS = (
+    ("has_product", "product"),
+    ("has_questions", "questions"),
+    ("has_faq", "faq_page"),
+    ("has_product_page", "product_page"),
+    ("has_comparison", "comparison_page"),
+)
+_SUMMARY_KEYS = frozenset(key for _, key in _SUMMARY_OUTPUTS)
+
+
 class SystemState(TypedDict, total=False):
     """
     Shared state for the multi-agent workflow.
     
-    total=False means all fields are optional.
+    total=False makes the generated content optional; the Required keys
+    are always set by create_initial_state, so they can be indexed
+    directly.
     """
     
     # Input
-    raw_data: dict
+    raw_data: Required[dict]
+    trusted_input: Required[bool]
     
     # Parsed data
     product: ProductModel
@@ -31,24 +47,32 @@ class SystemState(TypedDict, total=False):
     comparison_page: ComparisonPageModel
     
     # Metadata
-    errors: List[str]
-    execution_log: List[str]
+    generated_at: Required[datetime]
+    errors: Required[List[str]]
+    execution_log: Required[Deque[str]]
 
 
-def create_initial_state(raw_data: dict) -> SystemState:
+def create_initial_state(raw_data: dict, trusted: bool = False) -> SystemState:
     """
     Create initial system state with raw input data.
     
+    The execution log is created once here as a deque, so agents can
+    simply append to `state["execution_log"]`. The generation timestamp
+    is also taken once here so every page carries the same value.
+    
     Args:
         raw_data: Raw product data as dictionary
+        trusted: Whether raw_data has already been validated
         
     Returns:
         Initial SystemState
     """
     return {
         "raw_data": raw_data,
+        "trusted_input": trusted,
+        "generated_at": datetime.now(timezone.utc),
         "errors": [],
-        "execution_log": ["🚀 Workflow started"]
+        "execution_log": deque(["🚀 Workflow started"])
     }
 
 
@@ -56,6 +80,9 @@ def add_error(state: SystemState, error_message: str) -> SystemState:
     """
     Add an error to the state.
     
+    The state must come from create_initial_state, which always creates
+    the errors list and execution log.
+    
     Args:
         state: Current system state
         error_message: Error message to add
@@ -63,13 +90,8 @@ def add_error(state: SystemState, error_message: str) -> SystemState:
     Returns:
         Updated state
     """
-    errors = state.get("errors", [])
-    errors.append(error_message)
-    state["errors"] = errors
-    
-    log = state.get("execution_log", [])
-    log.append(f" Error: {error_message}")
-    state["execution_log"] = log
+    state["errors"].append(error_message)
+    state["execution_log"].append(f" Error: {error_message}")
     
     return state
 
@@ -84,8 +106,7 @@ def has_errors(state: SystemState) -> bool:
     Returns:
         True if there are errors
     """
-    errors = state.get("errors", [])
-    return len(errors) > 0
+    return bool(state["errors"])
 
 
 def get_state_summary(state: SystemState) -> dict:
@@ -98,12 +119,9 @@ def get_state_summary(state: SystemState) -> dict:
     Returns:
         Summary dictionary
     """
-    return {
-        "has_product": "product" in state,
-        "has_questions": "questions" in state,
-        "has_faq": "faq_page" in state,
-        "has_product_page": "product_page" in state,
-        "has_comparison": "comparison_page" in state,
-        "error_count": len(state.get("errors", [])),
-        "log_entries": len(state.get("execution_log", []))
-    }
+    present = _SUMMARY_KEYS & state.keys()
+    
+    summary = {field: key in present for field, key in _SUMMARY_OUTPUTS}
+    summary["error_count"] = len(state["errors"])
+    summary["log_entries"] = len(state["execution_log"])
+    return summary
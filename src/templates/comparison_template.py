@@ -8,12 +8,35 @@ Structure:
 - Recommendation section
 """
 
+from functools import lru_cache
 from typing import Dict, Any, List
 from src.models.templates import TemplateModel, TemplateSection
 
+# Literal format-rule data shared by every use of the template
+_MATRIX_DIMENSIONS = (
+    "Price",
+    "Concentration",
+    "Skin Type Coverage",
+    "Ingredients",
+    "Benefits",
+    "Safety"
+)
+_DETAILED_SECTIONS = (
+    "Price Analysis",
+    "Formula Comparison",
+    "Efficacy Comparison",
+    "Safety Comparison"
+)
+_RECOMMENDATION_STRUCTURE = (
+    "Who should choose Product A",
+    "Who should choose Product B",
+    "Overall recommendation"
+)
 
+
+@lru_cache(maxsize=None)
 def get_comparison_template() -> TemplateModel:
-    """Get the comparison page template."""
+    """Get the comparison page template (built once; the model is frozen and shared)."""
     sections = [
         TemplateSection(
             section_name="overview",
@@ -31,14 +54,7 @@ def get_comparison_template() -> TemplateModel:
             optional_blocks=[],
             llm_enhance=False,
             format_rules={
-                "dimensions": [
-                    "Price",
-                    "Concentration",
-                    "Skin Type Coverage",
-                    "Ingredients",
-                    "Benefits",
-                    "Safety"
-                ]
+                "dimensions": _MATRIX_DIMENSIONS
             }
         ),
         TemplateSection(
@@ -47,12 +63,7 @@ def get_comparison_template() -> TemplateModel:
             optional_blocks=[],
             llm_enhance=True,
             format_rules={
-                "sections": [
-                    "Price Analysis",
-                    "Formula Comparison",
-                    "Efficacy Comparison",
-                    "Safety Comparison"
-                ]
+                "sections": _DETAILED_SECTIONS
             }
         ),
         TemplateSection(
@@ -62,11 +73,7 @@ def get_comparison_template() -> TemplateModel:
             llm_enhance=True,
             format_rules={
                 "length": "3-5 sentences",
-                "structure": [
-                    "Who should choose Product A",
-                    "Who should choose Product B",
-                    "Overall recommendation"
-                ]
+                "structure": _RECOMMENDATION_STRUCTURE
             }
         )
     ]
@@ -7,12 +7,14 @@ Structure:
 - No logic blocks needed (content is LLM-generated)
 """
 
+from functools import lru_cache
 from typing import Dict, List
 from src.models.templates import TemplateModel, TemplateSection
 
 
+@lru_cache(maxsize=None)
 def get_faq_template() -> TemplateModel:
-    """Get the FAQ page template."""
+    """Get the FAQ page template (built once; the model is frozen and shared)."""
     sections = [
         TemplateSection(
             section_name="header",
@@ -10,12 +10,14 @@ Structure:
 - Pricing section (uses price_block)
 """
 
+from functools import lru_cache
 from typing import Dict, Any
 from src.models.templates import TemplateModel, TemplateSection
 
 
+@lru_cache(maxsize=None)
 def get_product_template() -> TemplateModel:
-    """Get the product page template."""
+    """Get the product page template (built once; the model is frozen and shared)."""
     sections = [
         TemplateSection(
             section_name="hero",
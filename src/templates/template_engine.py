@@ -4,22 +4,102 @@ Template engine - renders pages from templates and data.
 This is the core abstraction that separates structure from content.
 """
 
-from typing import Dict, Any, Callable
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, Iterator, NamedTuple, Optional, Sequence, Tuple
 from src.models.templates import TemplateModel, TemplateSection
 from src.models.product import ProductModel
+from src.utils.logger import logger
+
+
+# Worker threads used to run a template's blocks concurrently
+DEFAULT_MAX_WORKERS = 8
+
+# A plan entry: (section index, block name, block function, required)
+PlanEntry = Tuple[int, str, Callable, bool]
+
+
+class CompiledTemplate(NamedTuple):
+    """
+    A template resolved against the registered blocks.
+    
+    Section names are kept in their own tuple; the plan is a flat tuple
+    of (section index, block name, block function, required) entries in
+    render order. Blocks that are not registered are left out.
+    """
+    template_type: str
+    section_names: Tuple[str, ...]
+    plan: Tuple[PlanEntry, ...]
 
 
 class TemplateEngine:
     """
     Renders pages from template definitions and data.
+    
+    Blocks are independent of each other, so when a render has more than
+    one block they run concurrently on a shared thread pool. This pays
+    off for blocks that wait on the LLM; results keep the declared order.
     """
     
-    def __init__(self):
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS):
         self.registered_blocks: Dict[str, Callable] = {}
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Compiled plans keyed by template identity; the template is kept
+        # alongside so its id cannot be reused while the entry exists
+        self._compiled: Dict[int, Tuple[TemplateModel, CompiledTemplate]] = {}
     
     def register_block(self, block_name: str, block_func: Callable) -> None:
-        """Register a logic block."""
-        self.registered_blocks[block_name] = block_func
+        """
+        Register a logic block.
+        
+        Names are interned, so lookups with the same names from templates
+        (string literals, also interned) match by identity.
+        
+        Raises:
+            TypeError: If block_func is not callable
+        """
+        if not callable(block_func):
+            raise TypeError(f"Block {block_name!r} is not callable: {block_func!r}")
+        self.registered_blocks[sys.intern(block_name)] = block_func
+        self._compiled.clear()
+    
+    def compile(self, template: TemplateModel) -> CompiledTemplate:
+        """
+        Resolve a template into a flat execution plan.
+        
+        Plans are cached per template instance until another block is
+        registered.
+        
+        Args:
+            template: Template to compile
+            
+        Returns:
+            CompiledTemplate for the template
+        """
+        cached = self._compiled.get(id(template))
+        if cached is not None and cached[0] is template:
+            return cached[1]
+        
+        blocks = self.registered_blocks
+        plan = tuple(
+            (index, block_name, blocks[block_name], required)
+            for index, section in enumerate(template.sections)
+            for block_names, required in (
+                (section.required_blocks, True),
+                (section.optional_blocks, False),
+            )
+            for block_name in block_names
+            if block_name in blocks
+        )
+        compiled = CompiledTemplate(
+            template_type=template.template_type,
+            section_names=tuple(section.section_name for section in template.sections),
+            plan=plan
+        )
+        
+        self._compiled[id(template)] = (template, compiled)
+        return compiled
     
     def render_section(
         self,
@@ -30,37 +110,24 @@ class TemplateEngine:
         """
         Render a single section by combining required and optional blocks.
         """
-        result = {
+        blocks = self.registered_blocks
+        plan = [
+            (0, block_name, blocks[block_name], required)
+            for block_names, required in (
+                (section.required_blocks, True),
+                (section.optional_blocks, False),
+            )
+            for block_name in block_names
+            if block_name in blocks
+        ]
+        
+        return {
             "section_name": section.section_name,
-            "blocks": []
+            "blocks": [
+                {"name": block_name, "content": block_result, "required": required}
+                for _, block_name, required, block_result in self._run_blocks(plan, product)
+            ]
         }
-        
-        # Execute required blocks
-        for block_name in section.required_blocks:
-            if block_name in self.registered_blocks:
-                block_func = self.registered_blocks[block_name]
-                block_result = block_func(product)
-                result["blocks"].append({
-                    "name": block_name,
-                    "content": block_result,
-                    "required": True
-                })
-        
-        # Execute optional blocks if available
-        for block_name in section.optional_blocks:
-            if block_name in self.registered_blocks:
-                try:
-                    block_func = self.registered_blocks[block_name]
-                    block_result = block_func(product)
-                    result["blocks"].append({
-                        "name": block_name,
-                        "content": block_result,
-                        "required": False
-                    })
-                except Exception as e:
-                    print(f" Optional block {block_name} failed: {e}")
-        
-        return result
     
     def render_template(
         self,
@@ -69,18 +136,63 @@ class TemplateEngine:
         extra_context: Dict[str, Any] = None
     ) -> Dict[str, Any]:
         """
-        Render a complete template by rendering all sections.
+        Render a complete template by running its compiled plan.
         """
-        result = {
-            "template_type": template.template_type,
-            "sections": []
+        compiled = self.compile(template)
+        sections = [
+            {"section_name": section_name, "blocks": []}
+            for section_name in compiled.section_names
+        ]
+        
+        for index, block_name, required, block_result in self._run_blocks(compiled.plan, product):
+            sections[index]["blocks"].append({
+                "name": block_name,
+                "content": block_result,
+                "required": required
+            })
+        
+        return {
+            "template_type": compiled.template_type,
+            "sections": sections
         }
+    
+    def _run_blocks(
+        self,
+        plan: Sequence[PlanEntry],
+        product: ProductModel
+    ) -> Iterator[Tuple[int, str, bool, Any]]:
+        """
+        Run plan entries and yield (section index, block name, required,
+        result) in plan order.
         
-        for section in template.sections:
-            rendered_section = self.render_section(section, product, extra_context)
-            result["sections"].append(rendered_section)
+        Failures of required blocks propagate; failed optional blocks are
+        logged and skipped.
+        """
+        if len(plan) > 1:
+            executor = self._get_executor()
+            calls = [executor.submit(block_func, product).result for _, _, block_func, _ in plan]
+        else:
+            calls = [lambda block_func=block_func: block_func(product) for _, _, block_func, _ in plan]
         
-        return result
+        for (index, block_name, _, required), call in zip(plan, calls):
+            try:
+                block_result = call()
+            except Exception as e:
+                if required:
+                    raise
+                logger.warning(f" Optional block {block_name} failed: {e}")
+                continue
+            
+            yield index, block_name, required, block_result
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the engine's thread pool, creating it on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="template-block"
+            )
+        return self._executor
 
 
 def create_default_engine() -> TemplateEngine:
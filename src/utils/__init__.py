@@ -1,13 +1,44 @@
 """
 Utility modules for LLM interaction and file operations.
+
+Exports are resolved on first access (PEP 562), so importing one
+submodule, e.g. src.utils.file_writer, does not import the LLM stack.
 """
 
-from src.utils.llm_client import get_llm, get_structured_llm
-from src.utils.file_writer import write_json_output, ensure_output_directory
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.utils.llm_client import get_llm, get_structured_llm
+    from src.utils.file_writer import write_json_output, ensure_output_directory
+    from src.utils.logger import get_logger, flush_logs
+
+# Exported name -> defining submodule
+_EXPORTS = {
+    "get_llm": "src.utils.llm_client",
+    "get_structured_llm": "src.utils.llm_client",
+    "write_json_output": "src.utils.file_writer",
+    "ensure_output_directory": "src.utils.file_writer",
+    "get_logger": "src.utils.logger",
+    "flush_logs": "src.utils.logger",
+}
 
 __all__ = [
     "get_llm",
     "get_structured_llm",
     "write_json_output",
     "ensure_output_directory",
+    "get_logger",
+    "flush_logs",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import an exported name from its submodule on first access."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
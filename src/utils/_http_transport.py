@@ -0,0 +1,44 @@
+"""
+Async HTTP transport for the shared LLM client.
+
+Kept separate from llm_client so httpx is only imported when the first
+HTTP client is built.
+"""
+
+import asyncio
+import weakref
+import httpx
+
+
+class PerLoopTransport(httpx.AsyncBaseTransport):
+    """
+    Async transport that keeps one connection pool per event loop.
+    
+    Pooled connections are bound to the loop that opened them, so one
+    pool cannot serve a later asyncio.run() in the same process. Like
+    the request semaphores in llm_client, pools are kept per loop instead.
+    """
+    
+    def __init__(self, limits: httpx.Limits) -> None:
+        self._limits = limits
+        self._transports: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncHTTPTransport]" = (
+            weakref.WeakKeyDictionary()
+        )
+    
+    def _transport(self) -> httpx.AsyncHTTPTransport:
+        loop = asyncio.get_running_loop()
+        transport = self._transports.get(loop)
+        
+        if transport is None:
+            transport = httpx.AsyncHTTPTransport(limits=self._limits)
+            self._transports[loop] = transport
+        
+        return transport
+    
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport().handle_async_request(request)
+    
+    async def aclose(self) -> None:
+        transport = self._transports.pop(asyncio.get_running_loop(), None)
+        if transport is not None:
+            await transport.aclose()
@@ -4,21 +4,38 @@ File writing utilities for JSON output.
 Handles:
 - Creating output directories
 - Writing JSON with proper formatting
+- Buffered (and streaming) JSON input parsing
 - Error handling and logging
 """
 
-import json
 import os
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, Set
 from datetime import datetime
+import orjson
 from pydantic import BaseModel
+from pydantic_core import PydanticSerializationError
+from src.utils.logger import logger
+
+# Buffer sizes for input/output files (64KB keeps syscalls low)
+READ_BUFFER_SIZE = 65536
+WRITE_BUFFER_SIZE = 65536
+
+# orjson only supports 2-space indentation, so 0 (compact) is the only other choice
+SUPPORTED_INDENTS = (0, 2)
+
+
+# Output directories already created by this process
+_ENSURED_DIRS: Set[str] = set()
 
 
 def ensure_output_directory(output_dir: str = "output") -> Path:
     """
     Ensure output directory exists, create if it doesn't.
     
+    Each directory is only created (or checked) once per process, so
+    repeated writes to the same directory skip the mkdir syscall.
+    
     Args:
         output_dir: Directory path to ensure exists
         
@@ -30,11 +47,12 @@ def ensure_output_directory(output_dir: str = "output") -> Path:
     """
     output_path = Path(output_dir)
     
-    try:
+    if output_dir not in _ENSURED_DIRS:
         output_path.mkdir(parents=True, exist_ok=True)
-        return output_path
-    except OSError as e:
-        raise OSError(f"Failed to create output directory: {e}")
+        _ENSURED_DIRS.add(output_dir)
+    
+    return output_path
+
 
 def write_json_output(
     data: Any,
@@ -45,11 +63,14 @@ def write_json_output(
     """
     Write data to a JSON file with proper formatting.
     
+    The file is written to a temporary sibling and moved into place, so
+    readers never see a partially written file.
+    
     Args:
         data: Data to write (dict, list, or Pydantic model)
         filename: Output filename
         output_dir: Output directory path
-        indent: JSON indentation level
+        indent: JSON indentation level, 2 or 0 for compact JSON
         
     Returns:
         Path to the written file
@@ -57,6 +78,7 @@ def write_json_output(
     Raises:
         OSError: If file cannot be written
         TypeError: If data cannot be serialized
+        ValueError: If indent is not 0 or 2
         
     Example:
         >>> from src.models.pages import FAQPageModel
@@ -67,9 +89,28 @@ def write_json_output(
     output_path = ensure_output_directory(output_dir)
     file_path = output_path / filename
     
-    # Convert Pydantic models to dict
+    return _write_json_bytes(file_path, _to_json_bytes(data, indent))
+
+
+def _to_json_bytes(data: Any, indent: int = 2) -> bytes:
+    """
+    Serialize output data to JSON bytes.
+    
+    Raises:
+        TypeError: If data cannot be serialized
+        ValueError: If indent is not 0 or 2
+    """
+    if indent not in SUPPORTED_INDENTS:
+        raise ValueError(f"Unsupported JSON indent {indent!r}, expected 0 or 2")
+    
+    # Pydantic models go straight to JSON through their compiled
+    # serializer, without an intermediate dict (UTC timestamps get the
+    # same "Z" suffix as below)
     if isinstance(data, BaseModel):
-        data_dict = data.model_dump(mode='json')
+        try:
+            return data.model_dump_json(indent=indent or None).encode("utf-8")
+        except PydanticSerializationError as e:
+            raise TypeError(f"Cannot serialize {type(data).__name__} to JSON: {e}") from e
     elif isinstance(data, dict):
         data_dict = data
     elif isinstance(data, list):
@@ -77,21 +118,37 @@ def write_json_output(
     else:
         raise TypeError(f"Cannot serialize type {type(data)}")
     
-    # Custom JSON encoder for datetime objects
-    def json_serializer(obj):
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
+    # UTC timestamps keep the "Z" suffix Pydantic's JSON mode produces
+    option = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
     
     try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data_dict, f, indent=indent, default=json_serializer, ensure_ascii=False)
+        return orjson.dumps(data_dict, option=option)
+    except TypeError as e:
+        raise TypeError(f"Cannot serialize data to JSON: {e}") from e
+
+
+def _write_json_bytes(file_path: Path, json_bytes: bytes) -> Path:
+    """
+    Atomically replace a file with serialized JSON.
+    
+    Raises:
+        Exception: If the file cannot be written
+    """
+    tmp_path = file_path.with_name(file_path.name + ".tmp")
+    
+    try:
+        # Single write through a 64KB buffer instead of many small writes
+        with open(tmp_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(json_bytes)
+        os.replace(tmp_path, file_path)
         
-        file_size = file_path.stat().st_size
-        print(f" Written to: {file_path} ({file_size} bytes)")
+        logger.info(f" Written to: {file_path} ({len(json_bytes)} bytes)")
         return file_path
         
-    except (OSError, TypeError) as e:
+    except OSError as e:
+        tmp_path.unlink(missing_ok=True)
         raise Exception(f"Failed to write JSON file: {e}")
 
 def read_json_input(filepath: str) -> Dict[str, Any]:
@@ -114,10 +171,49 @@ def read_json_input(filepath: str) -> Dict[str, Any]:
         raise FileNotFoundError(f"Input file not found: {filepath}")
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(file_path, 'rb', buffering=READ_BUFFER_SIZE) as f:
+            data = orjson.loads(f.read())
         return data
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON in {filepath}: {e}")
+
+
+def read_json_input_stream(
+    filepath: str,
+    prefix: str = "products.item"
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream items from a large JSON input file without loading it whole.
+    
+    Requires the optional `ijson` dependency (pip install ".[batch]").
+    
+    Args:
+        filepath: Path to JSON file
+        prefix: ijson prefix of the items to yield
+            (default: each element of a top-level "products" array)
+        
+    Yields:
+        Parsed items one at a time
+        
+    Raises:
+        FileNotFoundError: If file does not exist
+        ValueError: If JSON is invalid
+        
+    Example:
+        >>> for product in read_json_input_stream("data/input/catalog.json"):
+        ...     print(product["name"])
+    """
+    import ijson
+    
+    file_path = Path(filepath)
+    
+    if not file_path.exists():
+        raise FileNotFoundError(f"Input file not found: {filepath}")
+    
+    try:
+        with open(file_path, 'rb', buffering=READ_BUFFER_SIZE) as f:
+            yield from ijson.items(f, prefix, use_float=True)
+    except ijson.JSONError as e:
         raise ValueError(f"Invalid JSON in {filepath}: {e}")
 
 def create_backup(filepath: str) -> Path:
@@ -159,24 +255,34 @@ def write_json_with_backup(
     """
     Write JSON output with automatic backup of existing file.
     
+    The existing file is only backed up when the new content differs
+    from it.
+    
     Args:
         data: Data to write
         filename: Output filename
         output_dir: Output directory
-        indent: JSON indentation
+        indent: JSON indentation level, 2 or 0 for compact JSON
         
     Returns:
         Path to written file
     """
     output_path = ensure_output_directory(output_dir)
     file_path = output_path / filename
+    json_bytes = _to_json_bytes(data, indent)
+    
+    # Back up the existing file unless it already holds this content;
+    # reading it directly avoids a separate exists() stat
+    try:
+        existing = file_path.read_bytes()
+    except FileNotFoundError:
+        existing = None
     
-    # Create backup if file exists
-    if file_path.exists():
+    if existing is not None and existing != json_bytes:
         create_backup(str(file_path))
     
     # Write new file
-    return write_json_output(data, filename, output_dir, indent)
+    return _write_json_bytes(file_path, json_bytes)
 
 
 def get_output_summary(output_dir: str = "output") -> Dict[str, Any]:
@@ -205,14 +311,19 @@ def get_output_summary(output_dir: str = "output") -> Dict[str, Any]:
     files = []
     total_size = 0
     
-    for file_path in output_path.glob("*.json"):
-        file_size = file_path.stat().st_size
-        files.append({
-            "name": file_path.name,
-            "size_bytes": file_size,
-            "modified": datetime.fromtimestamp(file_path.stat().st_mtime).isoformat()
-        })
-        total_size += file_size
+    # One stat per file, reusing the directory entry's cached type info
+    with os.scandir(output_path) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".json") or not entry.is_file():
+                continue
+            
+            stat = entry.stat()
+            files.append({
+                "name": entry.name,
+                "size_bytes": stat.st_size,
+                "modified": datetime.fromtimestamp(stat.st_mtime).isoformat()
+            })
+            total_size += stat.st_size
     
     return {
         "total_files": len(files),
@@ -0,0 +1,126 @@
+"""
+Persistent response cache for deterministic LLM calls.
+
+This module provides:
+- A SQLite-backed LangChain cache keyed by SHA256 of prompt + model config
+- A temperature gate so only near-deterministic calls are cached
+
+Repeated runs over the same input then skip the network round-trip.
+Set LLM_CACHE_PATH to an empty string to disable caching.
+"""
+
+import hashlib
+import os
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import orjson
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.load import dumps, loads
+from src.utils.logger import logger
+
+# Only calls at or below this temperature are cached
+MAX_CACHEABLE_TEMPERATURE = 0.3
+
+DEFAULT_CACHE_PATH = ".llm_cache.sqlite"
+
+_cache: Optional["SQLiteLLMCache"] = None
+
+
+def cache_key(prompt: str, llm_string: str) -> str:
+    """
+    Build a stable cache key for a prompt and model configuration.
+
+    Args:
+        prompt: Serialized prompt sent to the model
+        llm_string: Serialized model configuration (model, temperature, ...)
+
+    Returns:
+        Hex-encoded SHA256 digest
+    """
+    return hashlib.sha256(orjson.dumps([llm_string, prompt])).hexdigest()
+
+
+class SQLiteLLMCache(BaseCache):
+    """
+    LangChain cache that persists generations to a SQLite file.
+    """
+
+    def __init__(self, database_path: str = DEFAULT_CACHE_PATH):
+        self.database_path = Path(database_path)
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        # A connection per operation keeps the cache safe across threads
+        return sqlite3.connect(self.database_path, timeout=30)
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        """Return cached generations, or None on a miss."""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT value FROM llm_cache WHERE key = ?",
+                (cache_key(prompt, llm_string),)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        try:
+            return [loads(generation) for generation in orjson.loads(row[0])]
+        except Exception as e:
+            logger.warning(f" Ignoring unreadable LLM cache entry: {e}")
+            return None
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        """Store generations for a prompt."""
+        value = orjson.dumps([dumps(generation) for generation in return_val]).decode("utf-8")
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value) VALUES (?, ?)",
+                (cache_key(prompt, llm_string), value)
+            )
+
+    def clear(self, **kwargs: Any) -> None:
+        """Remove every cached entry."""
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM llm_cache")
+
+
+def get_llm_cache() -> Optional[SQLiteLLMCache]:
+    """
+    Get the shared persistent cache.
+
+    Returns:
+        SQLiteLLMCache instance, or None if caching is disabled
+    """
+    global _cache
+
+    cache_path = os.getenv("LLM_CACHE_PATH", DEFAULT_CACHE_PATH)
+    if not cache_path:
+        return None
+
+    if _cache is None or _cache.database_path != Path(cache_path):
+        _cache = SQLiteLLMCache(cache_path)
+    return _cache
+
+
+def cache_for_temperature(temperature: float) -> Union[SQLiteLLMCache, bool]:
+    """
+    Choose the cache setting for a chat model.
+
+    Args:
+        temperature: Sampling temperature of the model
+
+    Returns:
+        The persistent cache for near-deterministic calls, otherwise False
+        (which also keeps LangChain's global cache out of the way)
+    """
+    if temperature > MAX_CACHEABLE_TEMPERATURE:
+        return False
+    return get_llm_cache() or False
@@ -5,13 +5,28 @@ This module provides:
 - Centralized LLM configuration
 - Structured output support via Pydantic
 - Consistent error handling
+- Persistent response caching for low-temperature calls
+- Concurrency-limited async invocation with rate-limit backoff
+- Shared chat model instances and HTTP connection pools
+
+LangChain, the OpenAI SDK and httpx are imported on first use, so importing
+this module (or src.utils) stays cheap for callers that never call an LLM.
 """
 
+import asyncio
 import os
-from typing import Type, TypeVar
+import random
+import weakref
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Optional, Type, TypeVar
 from dotenv import load_dotenv
-from langchain_openai import ChatOpenAI
 from pydantic import BaseModel
+from src.utils.logger import logger
+
+if TYPE_CHECKING:
+    import httpx
+    from langchain_core.runnables import Runnable
+    from langchain_openai import ChatOpenAI
 
 # Load environment variables
 load_dotenv()
@@ -19,18 +34,64 @@ load_dotenv()
 # Type variable for Pydantic models
 T = TypeVar('T', bound=BaseModel)
 
+# Maximum number of in-flight OpenAI requests per event loop
+MAX_CONCURRENCY = int(os.getenv("OPENAI_MAX_CONCURRENCY", "8"))
+
+# Backoff (seconds) before each retry of a rate-limited request: one
+# retry per entry, so a request is attempted at most len + 1 = 4 times
+RATE_LIMIT_BACKOFF = (1, 2, 4)
+
+# Each backoff is scaled by a random factor in [1 - jitter, 1 + jitter],
+# so concurrent calls limited together do not all retry at the same instant
+RATE_LIMIT_JITTER = 0.5
+
+# Connection pool size shared by every chat model
+HTTP_MAX_CONNECTIONS = 32
+
+_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
 
-def get_llm(temperature: float = 0.7, model: str = "gpt-4o-mini") -> ChatOpenAI:
+
+def _http_limits() -> "httpx.Limits":
+    """Connection pool limits shared by every chat model."""
+    import httpx
+    
+    return httpx.Limits(
+        max_connections=HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=HTTP_MAX_CONNECTIONS
+    )
+
+
+@lru_cache(maxsize=None)
+def _shared_http_client() -> "httpx.Client":
+    """Get the HTTP client shared by all synchronous LLM calls."""
+    from openai import DefaultHttpxClient
+    
+    return DefaultHttpxClient(limits=_http_limits())
+
+
+@lru_cache(maxsize=None)
+def _shared_async_http_client() -> "httpx.AsyncClient":
     """
-    Get a standard LLM instance for text generation.
+    Get the HTTP client shared by all asynchronous LLM calls.
+    
+    The client itself is loop-independent; its connection pools are
+    kept per event loop by PerLoopTransport.
+    """
+    from openai import DefaultAsyncHttpxClient
+    from src.utils._http_transport import PerLoopTransport
+    
+    return DefaultAsyncHttpxClient(transport=PerLoopTransport(_http_limits()))
+
+
+@lru_cache(maxsize=None)
+def _api_key() -> str:
+    """
+    Read the OpenAI API key once.
+    
+    A missing key is not cached, so setting it later still works.
     
-    Args:
-        temperature: Creativity level (0.0-1.0)
-        model: Model name
-        
-    Returns:
-        Configured ChatOpenAI instance
-        
     Raises:
         ValueError: If OPENAI_API_KEY is not set
     """
@@ -39,28 +100,82 @@ def get_llm(temperature: float = 0.7, model: str = "gpt-4o-mini") -> ChatOpenAI:
     if not api_key:
         raise ValueError("OPENAI_API_KEY environment variable not set")
     
+    return api_key
+
+
+@lru_cache(maxsize=32)
+def _build_chat_model(
+    temperature: float,
+    model: str,
+    max_tokens: Optional[int] = None
+) -> "ChatOpenAI":
+    """
+    Get the ChatOpenAI instance for a configuration, constructing it once.
+    
+    Calls with temperature <= 0.3 are served from the persistent cache
+    when possible. All instances share the same HTTP connection pools,
+    and structured-output runnables wrap these same instances.
+    
+    Raises:
+        ValueError: If OPENAI_API_KEY is not set
+    """
+    from langchain_openai import ChatOpenAI
+    from src.utils.llm_cache import cache_for_temperature
+    
+    kwargs = {} if max_tokens is None else {"max_tokens": max_tokens}
+    
     return ChatOpenAI(
-        api_key=api_key,
+        api_key=_api_key(),
         model=model,
-        temperature=temperature
+        temperature=temperature,
+        cache=cache_for_temperature(temperature),
+        http_client=_shared_http_client(),
+        http_async_client=_shared_async_http_client(),
+        **kwargs
     )
 
 
+def get_llm(temperature: float = 0.7, model: str = "gpt-4o-mini") -> "ChatOpenAI":
+    """
+    Get a standard LLM instance for text generation.
+    
+    Instances come from the _build_chat_model cache, so each
+    (temperature, model) is constructed once and reused across agents.
+    
+    Args:
+        temperature: Creativity level (0.0-1.0)
+        model: Model name
+        
+    Returns:
+        Configured ChatOpenAI instance
+        
+    Raises:
+        ValueError: If OPENAI_API_KEY is not set
+    """
+    return _build_chat_model(temperature, model, None)
+
+
+@lru_cache(maxsize=32)
 def get_structured_llm(
     pydantic_model: Type[T],
     temperature: float = 0.3,
-    model: str = "gpt-4o-mini"
-) -> ChatOpenAI:
+    model: str = "gpt-4o-mini",
+    max_tokens: Optional[int] = None
+) -> "ChatOpenAI":
     """
     Get an LLM instance configured for structured output.
     
     This uses OpenAI's function calling to ensure the response
     matches the provided Pydantic model exactly.
     
+    Instances are cached per (model class, temperature, model name,
+    token limit), so the schema is bound once and reused by every call.
+    
     Args:
         pydantic_model: Pydantic model for response validation
         temperature: Creativity level (lower for structured output)
         model: Model name
+        max_tokens: Optional cap on response tokens
         
     Returns:
         Configured ChatOpenAI instance with structured output
@@ -69,16 +184,7 @@ def get_structured_llm(
         >>> llm = get_structured_llm(QuestionModel)
         >>> # response is automatically parsed as QuestionModel
     """
-    api_key = os.getenv("OPENAI_API_KEY")
-    
-    if not api_key:
-        raise ValueError("OPENAI_API_KEY environment variable not set")
-    
-    llm = ChatOpenAI(
-        api_key=api_key,
-        model=model,
-        temperature=temperature
-    )
+    llm = _build_chat_model(temperature, model, max_tokens)
     
     # Bind the Pydantic model for structured output
     return llm.with_structured_output(pydantic_model)
@@ -88,11 +194,12 @@ def get_llm_with_token_limit(
     max_tokens: int = 2000,
     temperature: float = 0.7,
     model: str = "gpt-4o-mini"
-) -> ChatOpenAI:
+) -> "ChatOpenAI":
     """
     Get an LLM instance with explicit token limit.
     
-    Useful for controlling output length in specific agents.
+    Useful for controlling output length in specific agents. Instances
+    are cached per (max_tokens, temperature, model).
     
     Args:
         max_tokens: Maximum tokens in response
@@ -102,17 +209,60 @@ def get_llm_with_token_limit(
     Returns:
         Configured ChatOpenAI instance with token limit
     """
-    api_key = os.getenv("OPENAI_API_KEY")
+    return _build_chat_model(temperature, model, max_tokens)
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    """
+    Get the request semaphore for the running event loop.
     
-    if not api_key:
-        raise ValueError("OPENAI_API_KEY environment variable not set")
+    Semaphores are bound to a loop, so one is kept per loop rather than
+    a single module-level instance.
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
     
-    return ChatOpenAI(
-        api_key=api_key,
-        model=model,
-        temperature=temperature,
-        max_tokens=max_tokens
-    )
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+        _semaphores[loop] = semaphore
+    
+    return semaphore
+
+
+async def ainvoke_llm(llm: "Runnable", prompt: Any) -> Any:
+    """
+    Invoke an LLM asynchronously with bounded concurrency.
+    
+    At most OPENAI_MAX_CONCURRENCY requests are in flight at once.
+    A rate-limited request is retried up to 3 times, after about 1s, 2s
+    and 4s (each randomized by RATE_LIMIT_JITTER), so it is attempted at
+    most 4 times in total. These retries come on top of any the OpenAI
+    SDK makes itself (ChatOpenAI.max_retries).
+    
+    Args:
+        llm: LLM or structured-output runnable from this module
+        prompt: Prompt passed to the runnable
+        
+    Returns:
+        The runnable's response
+        
+    Raises:
+        RateLimitError: If the request is still rate limited after all retries
+    """
+    from openai import RateLimitError
+    
+    for delay in RATE_LIMIT_BACKOFF:
+        try:
+            async with _get_semaphore():
+                return await llm.ainvoke(prompt)
+        except RateLimitError:
+            wait = delay * random.uniform(1 - RATE_LIMIT_JITTER, 1 + RATE_LIMIT_JITTER)
+            logger.warning(f" Rate limited by OpenAI, retrying in {wait:.1f}s")
+            await asyncio.sleep(wait)
+    
+    # Last retry; a rate limit here is raised to the caller
+    async with _get_semaphore():
+        return await llm.ainvoke(prompt)
 
 
 # Configuration constants
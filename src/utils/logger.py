@@ -0,0 +1,60 @@
+"""
+Buffered progress logging for agents and utilities.
+
+This module provides:
+- A shared "agents" logger that prints plain messages to stdout
+- A handler that does not flush after every record
+- flush_logs() to push buffered output at step boundaries
+
+StreamHandler flushes after each record, which turns every progress
+line into a write syscall when stdout is a pipe (containers, CI).
+Records here stay in stdout's buffer until flush_logs() is called or a
+warning/error is logged.
+"""
+
+import logging
+import sys
+
+LOGGER_NAME = "agents"
+
+
+class BufferedStreamHandler(logging.StreamHandler):
+    """
+    StreamHandler that only flushes for warnings and errors.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.WARNING:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+
+def get_logger() -> logging.Logger:
+    """
+    Get the shared progress logger, configuring it on first use.
+
+    Returns:
+        Logger writing unformatted messages to stdout
+    """
+    logger = logging.getLogger(LOGGER_NAME)
+
+    if not logger.handlers:
+        handler = BufferedStreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+
+    return logger
+
+
+def flush_logs() -> None:
+    """Flush any buffered progress output."""
+    for handler in get_logger().handlers:
+        handler.flush()
+
+
+logger = get_logger()
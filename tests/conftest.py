@@ -0,0 +1,39 @@
+"""
+Shared fixtures.
+"""
+
+import pytest
+
+from src.models.product import ProductModel
+
+# Sample product used across the tests (mirrors data/input/product_data.json)
+SAMPLE_PRODUCT = {
+    "name": "GlowBoost Vitamin C Serum",
+    "concentration": "10% Vitamin C",
+    "skin_types": ["Oily", "Combination"],
+    "ingredients": ["Vitamin C", "Hyaluronic Acid"],
+    "benefits": ["Brightening", "Fades dark spots"],
+    "usage": "Apply 2-3 drops in the morning before sunscreen",
+    "side_effects": "Mild tingling for sensitive skin",
+    "price": 699,
+}
+
+
+@pytest.fixture
+def product_data():
+    """Raw fields of the sample product (a fresh copy per test)."""
+    return {key: list(value) if isinstance(value, list) else value for key, value in SAMPLE_PRODUCT.items()}
+
+
+@pytest.fixture
+def make_product(product_data):
+    """Factory building the sample product, with field overrides."""
+    def make(**overrides) -> ProductModel:
+        return ProductModel(**{**product_data, **overrides})
+    return make
+
+
+@pytest.fixture
+def product(make_product):
+    """The sample product."""
+    return make_product()
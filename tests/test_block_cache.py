@@ -0,0 +1,86 @@
+"""
+Tests for the logic-block result cache.
+"""
+
+import asyncio
+
+from src.logic_blocks._cache import clear_block_caches, memoize_block, uncached
+
+
+def test_hit_returns_deep_copy(make_product):
+    calls = []
+
+    @memoize_block()
+    def block(product):
+        calls.append(product.name)
+        return {"items": [product.name]}
+
+    product = make_product()
+    first = block(product)
+    first["items"].append("mutated")
+
+    assert block(product) == {"items": [product.name]}
+    assert len(calls) == 1
+
+
+def test_key_is_product_content_not_identity(make_product):
+    calls = []
+
+    @memoize_block()
+    def block(product):
+        calls.append(product.price)
+        return {"price": product.price}
+
+    block(make_product())
+    block(make_product())
+    block(make_product(price=799))
+
+    assert calls == [699, 799]
+
+
+def test_uncached_result_is_not_stored(make_product):
+    calls = []
+
+    @memoize_block()
+    def block(product, fail):
+        calls.append(fail)
+        result = {"degraded": fail}
+        return uncached(result) if fail else result
+
+    product = make_product()
+    assert block(product, True) == {"degraded": True}
+    assert block(product, True) == {"degraded": True}
+    assert calls == [True, True]
+
+
+def test_async_uncached_result_is_not_stored(make_product):
+    calls = []
+
+    @memoize_block()
+    async def block(product):
+        calls.append(product.name)
+        return uncached({"degraded": True})
+
+    product = make_product()
+    asyncio.run(block(product))
+    asyncio.run(block(product))
+
+    assert len(calls) == 2
+
+
+def test_lru_eviction_and_clear(make_product):
+    calls = []
+
+    @memoize_block(maxsize=1)
+    def block(product):
+        calls.append(product.price)
+        return product.price
+
+    block(make_product(price=1))
+    block(make_product(price=2))
+    block(make_product(price=1))
+    assert calls == [1, 2, 1]
+
+    clear_block_caches()
+    block(make_product(price=1))
+    assert calls == [1, 2, 1, 1]
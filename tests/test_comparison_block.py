@@ -0,0 +1,20 @@
+"""
+Tests for the comparison block.
+"""
+
+from src.logic_blocks.comparison_block import (
+    generate_comparison_block,
+    generate_comparison_blocks_batch,
+)
+
+
+def test_batch_matches_pairwise_comparisons(make_product):
+    product_a = make_product()
+    competitors = [
+        make_product(name=f"Competitor {i}", price=400 + 100 * i)
+        for i in range(5)
+    ]
+
+    batch = generate_comparison_blocks_batch(product_a, iter(competitors))
+
+    assert batch == [generate_comparison_block(product_a, b) for b in competitors]
@@ -0,0 +1,24 @@
+"""
+Tests for the rule-based FAQ fallback answers.
+"""
+
+from typing import get_args
+
+import pytest
+
+from src.agents.faq_generator import _FALLBACK_ANSWERS, _generate_fallback_answer
+from src.models.question import QuestionCategory, QuestionModel
+
+
+def test_fallback_keys_are_question_categories():
+    assert set(_FALLBACK_ANSWERS) <= set(get_args(QuestionCategory))
+
+
+@pytest.mark.parametrize("category", get_args(QuestionCategory))
+def test_every_category_has_a_specific_answer(product, category):
+    question = QuestionModel(category=category, question="A question long enough?")
+
+    answer = _generate_fallback_answer(product, question)
+
+    assert answer == _FALLBACK_ANSWERS[category](product)
+    assert len(answer) >= 20
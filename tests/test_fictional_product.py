@@ -0,0 +1,91 @@
+"""
+Tests for the rule-based fictional competitor (Product B).
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.agents.comparison_generator import COMPETITOR_NAME_POOL, _generate_fictional_product
+from src.models.product import ProductModel
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Mostly ingredients without a like-for-like substitute
+MANY_INGREDIENTS = [
+    "Vitamin C",
+    "Ferulic Acid",
+    "Rosehip Oil",
+    "Jojoba Oil",
+    "Kojic Acid",
+    "Arbutin",
+    "Peptides",
+    "Bisabolol",
+    "Caffeine",
+    "Glycerin",
+]
+
+
+def test_same_product_a_gives_same_product_b(make_product):
+    assert _generate_fictional_product(make_product()) == _generate_fictional_product(make_product())
+
+
+def test_product_b_does_not_depend_on_hash_seed(product_data):
+    # The seed comes from crc32, not hash(), so it is stable across processes
+    script = (
+        "from src.agents.comparison_generator import _generate_fictional_product\n"
+        "from src.models.product import ProductModel\n"
+        f"print(_generate_fictional_product(ProductModel(**{product_data!r})).model_dump_json())\n"
+    )
+    outputs = set()
+    for hash_seed in ("1", "2"):
+        env = {**os.environ, "PYTHONHASHSEED": hash_seed}
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=ROOT, env=env, capture_output=True, text=True, check=True
+        )
+        outputs.add(result.stdout)
+
+    assert len(outputs) == 1
+
+
+@pytest.mark.parametrize("count", range(1, len(MANY_INGREDIENTS) + 1))
+def test_ingredient_overlap_stays_in_range(make_product, count):
+    ingredients = MANY_INGREDIENTS[:count]
+    product_b = _generate_fictional_product(make_product(ingredients=ingredients))
+
+    swapped = sum(a != b for a, b in zip(ingredients, product_b.ingredients))
+
+    assert len(product_b.ingredients) == count
+    assert len({i.lower() for i in product_b.ingredients}) == count
+    assert max(1, round(count * 0.3)) <= swapped <= max(1, round(count * 0.5))
+
+
+def test_price_within_thirty_percent(product):
+    product_b = _generate_fictional_product(product)
+
+    assert 0.7 * 699 <= product_b.price <= 1.3 * 699
+
+
+@pytest.mark.parametrize("price", [0.01, 0.4, 1, 2.5])
+def test_low_prices_stay_positive(make_product, price):
+    product_b = _generate_fictional_product(make_product(price=price))
+
+    assert 0.01 <= product_b.price <= max(0.01, round(1.3 * price, 2))
+
+
+def test_unvalidated_product_without_ingredients(product_data):
+    product_a = ProductModel.model_construct(**{**product_data, "ingredients": []})
+
+    product_b = _generate_fictional_product(product_a)
+
+    assert product_b.ingredients
+
+
+def test_name_containing_every_brand(make_product):
+    product_b = _generate_fictional_product(make_product(name=" ".join(COMPETITOR_NAME_POOL)))
+
+    assert product_b.name.split()[0] in COMPETITOR_NAME_POOL
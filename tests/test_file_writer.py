@@ -0,0 +1,110 @@
+"""
+Tests for JSON output writing.
+"""
+
+from datetime import datetime, timezone
+
+import orjson
+import pytest
+
+from src.models.pages import FAQPageModel
+from src.models.question import QuestionAnswerModel
+from src.utils import file_writer
+from src.utils.file_writer import (
+    ensure_output_directory,
+    write_json_output,
+    write_json_with_backup,
+)
+
+
+def _backups(directory):
+    return sorted(p.name for p in directory.iterdir() if "_backup_" in p.name)
+
+
+def test_write_leaves_no_temporary_file(tmp_path):
+    path = write_json_output({"a": 1}, "out.json", str(tmp_path))
+
+    assert orjson.loads(path.read_bytes()) == {"a": 1}
+    assert [p.name for p in tmp_path.iterdir()] == ["out.json"]
+
+
+def test_failed_write_removes_temporary_file_and_keeps_original(tmp_path, monkeypatch):
+    write_json_output({"version": 1}, "out.json", str(tmp_path))
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(file_writer.os, "replace", failing_replace)
+
+    with pytest.raises(Exception, match="Failed to write JSON file"):
+        write_json_output({"version": 2}, "out.json", str(tmp_path))
+
+    assert [p.name for p in tmp_path.iterdir()] == ["out.json"]
+    assert orjson.loads((tmp_path / "out.json").read_bytes()) == {"version": 1}
+
+
+def test_backup_only_when_content_changes(tmp_path):
+    write_json_with_backup({"a": 1}, "out.json", str(tmp_path))
+    write_json_with_backup({"a": 1}, "out.json", str(tmp_path))
+    assert _backups(tmp_path) == []
+
+    write_json_with_backup({"a": 2}, "out.json", str(tmp_path))
+    backups = _backups(tmp_path)
+
+    assert len(backups) == 1
+    assert orjson.loads((tmp_path / backups[0]).read_bytes()) == {"a": 1}
+    assert orjson.loads((tmp_path / "out.json").read_bytes()) == {"a": 2}
+
+
+def test_models_and_dicts_serialize_timestamps_alike(tmp_path):
+    generated_at = datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+    page = FAQPageModel(
+        product_name="GlowBoost Vitamin C Serum",
+        faqs=[QuestionAnswerModel(
+            question="How do I use this serum?",
+            answer="Apply 2-3 drops to clean skin every morning.",
+            category="usage",
+        )],
+        generated_at=generated_at,
+    )
+
+    model_path = write_json_output(page, "model.json", str(tmp_path))
+    dict_path = write_json_output(page.model_dump(), "dict.json", str(tmp_path))
+
+    assert orjson.loads(model_path.read_bytes())["generated_at"] == "2024-01-15T10:30:00Z"
+    assert model_path.read_bytes() == dict_path.read_bytes()
+
+
+@pytest.mark.parametrize("data", [{"value": object()}, [object()]])
+def test_unserializable_data_raises_type_error(tmp_path, data):
+    with pytest.raises(TypeError, match="Cannot serialize"):
+        write_json_output(data, "out.json", str(tmp_path))
+
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize("indent", [0, 2])
+def test_models_and_dicts_share_indent_behaviour(tmp_path, indent):
+    faq = QuestionAnswerModel(
+        question="Is this serum safe?",
+        answer="Yes, patch test before first use.",
+        category="safety",
+    )
+
+    model_path = write_json_output(faq, "model.json", str(tmp_path), indent=indent)
+    dict_path = write_json_output(faq.model_dump(), "dict.json", str(tmp_path), indent=indent)
+
+    assert model_path.read_bytes() == dict_path.read_bytes()
+
+
+@pytest.mark.parametrize("indent", [1, 4, None])
+def test_unsupported_indent_is_rejected(tmp_path, indent):
+    with pytest.raises(ValueError, match="Unsupported JSON indent"):
+        write_json_output({"a": 1}, "out.json", str(tmp_path), indent=indent)
+
+
+def test_ensure_output_directory_creates_nested_path(tmp_path):
+    target = tmp_path / "a" / "b"
+
+    assert ensure_output_directory(str(target)) == target
+    assert target.is_dir()
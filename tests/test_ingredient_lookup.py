@@ -0,0 +1,125 @@
+"""
+Tests for the batched LLM ingredient lookup (the LLM call is stubbed).
+"""
+
+import asyncio
+
+import pytest
+
+from src.logic_blocks import clear_block_caches
+from src.logic_blocks import ingredient_block
+from src.logic_blocks.ingredient_block import (
+    IngredientInfo,
+    IngredientInfoList,
+    generate_ingredient_block,
+    get_ingredient_info_batch,
+)
+from src.models.product import ProductModel
+
+
+def _requested(prompt):
+    """Ingredient names sent in a lookup prompt."""
+    text = prompt[-1][1]
+    return text.split(": ", 1)[1].split(", ")
+
+
+@pytest.fixture
+def llm_calls(monkeypatch):
+    calls = []
+
+    async def fake_ainvoke_llm(llm, prompt):
+        names = _requested(prompt)
+        calls.append(names)
+        if "Broken" in names:
+            raise ValueError("truncated response")
+        return IngredientInfoList(ingredients=[
+            IngredientInfo(ingredient=name, function=f"{name} function", benefits=["Soothing"])
+            for name in names
+        ])
+
+    monkeypatch.setattr(ingredient_block, "get_structured_llm", lambda *args, **kwargs: None)
+    monkeypatch.setattr(ingredient_block, "ainvoke_llm", fake_ainvoke_llm)
+    clear_block_caches()
+    yield calls
+    clear_block_caches()
+
+
+@pytest.fixture
+def token_limits(llm_calls, monkeypatch):
+    limits = []
+
+    def fake_get_structured_llm(model, temperature, max_tokens):
+        limits.append(max_tokens)
+
+    monkeypatch.setattr(ingredient_block, "get_structured_llm", fake_get_structured_llm)
+    return limits
+
+
+def test_batch_skips_known_and_duplicate_ingredients(llm_calls):
+    info = asyncio.run(get_ingredient_info_batch([
+        "Vitamin C", "Ferulic Acid", "ferulic acid", "Niacinamide", "Squalane",
+    ]))
+
+    assert llm_calls == [["Ferulic Acid", "Squalane"]]
+    assert set(info) == {"ferulic acid", "squalane"}
+
+
+def test_batch_reuses_earlier_lookups(llm_calls):
+    asyncio.run(get_ingredient_info_batch(["Ferulic Acid"]))
+    asyncio.run(get_ingredient_info_batch(["FERULIC ACID", "Squalane"]))
+
+    assert llm_calls == [["Ferulic Acid"], ["Squalane"]]
+
+
+def test_ingredient_block_uses_batch_results_without_llm(llm_calls, monkeypatch):
+    asyncio.run(get_ingredient_info_batch(["Ferulic Acid"]))
+
+    def no_sync_llm(*args, **kwargs):
+        raise AssertionError("ingredient block should not call the LLM")
+
+    monkeypatch.setattr(ingredient_block, "get_structured_llm", no_sync_llm)
+    product = ProductModel(
+        name="Ferulic Serum",
+        concentration="15% Vitamin C",
+        skin_types=["Dry"],
+        ingredients=["Vitamin C", "Ferulic Acid"],
+        benefits=["Brightening"],
+        usage="Apply at night",
+        side_effects="None known",
+        price=999,
+    )
+
+    block = generate_ingredient_block(product)
+
+    assert [i["ingredient"] for i in block["ingredients"]] == ["Vitamin C", "Ferulic Acid"]
+    assert block["ingredients"][1]["function"] == "Ferulic Acid function"
+
+
+def test_remembered_details_are_bounded_and_cleared(llm_calls, monkeypatch):
+    monkeypatch.setattr(ingredient_block, "LLM_INGREDIENT_CACHE_SIZE", 2)
+
+    info = asyncio.run(get_ingredient_info_batch(["Alpha", "Beta", "Gamma"]))
+    assert list(info) == ["beta", "gamma"]
+
+    clear_block_caches()
+    assert asyncio.run(get_ingredient_info_batch([])) == {}
+
+
+def test_batch_is_split_into_chunks_with_sized_token_limits(llm_calls, token_limits, monkeypatch):
+    monkeypatch.setattr(ingredient_block, "INGREDIENT_BATCH_SIZE", 2)
+
+    info = asyncio.run(get_ingredient_info_batch(["Alpha", "Beta", "Gamma", "Delta", "Epsilon"]))
+
+    assert sorted(map(tuple, llm_calls)) == [("Alpha", "Beta"), ("Epsilon",), ("Gamma", "Delta")]
+    assert sorted(token_limits) == sorted(
+        ingredient_block.TOKENS_PER_INGREDIENT * n for n in (2, 2, 1)
+    )
+    assert len(info) == 5
+
+
+def test_failed_chunk_only_loses_its_own_ingredients(llm_calls, monkeypatch):
+    monkeypatch.setattr(ingredient_block, "INGREDIENT_BATCH_SIZE", 2)
+
+    info = asyncio.run(get_ingredient_info_batch(["Alpha", "Broken", "Gamma", "Delta"]))
+
+    assert set(info) == {"gamma", "delta"}
@@ -0,0 +1,98 @@
+"""
+Tests for the shared LLM HTTP clients (no OpenAI calls are made).
+"""
+
+import asyncio
+import http.server
+import threading
+
+import pytest
+
+from src.utils import llm_client
+from src.utils.llm_client import _shared_async_http_client
+
+
+class _OkHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_url():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _OkHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/"
+    server.shutdown()
+    server.server_close()
+
+
+def test_async_client_survives_successive_event_loops(local_url):
+    client = _shared_async_http_client()
+
+    async def fetch():
+        response = await client.get(local_url)
+        return response.status_code
+
+    # Keep-alive connections from the first loop must not be reused by the second
+    assert asyncio.run(fetch()) == 200
+    assert asyncio.run(fetch()) == 200
+
+
+class _RateLimitedLLM:
+    """Runnable stub that is rate limited a fixed number of times."""
+
+    def __init__(self, failures):
+        self.failures = failures
+        self.calls = 0
+
+    async def ainvoke(self, prompt):
+        import httpx
+        from openai import RateLimitError
+
+        self.calls += 1
+        if self.calls <= self.failures:
+            response = httpx.Response(429, request=httpx.Request("POST", "http://test"))
+            raise RateLimitError("rate limited", response=response, body=None)
+        return prompt
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    waits = []
+
+    async def fake_sleep(delay):
+        waits.append(delay)
+
+    monkeypatch.setattr(llm_client.asyncio, "sleep", fake_sleep)
+    return waits
+
+
+def test_rate_limited_call_is_attempted_four_times(sleeps):
+    from openai import RateLimitError
+
+    llm = _RateLimitedLLM(failures=10)
+
+    with pytest.raises(RateLimitError):
+        asyncio.run(llm_client.ainvoke_llm(llm, "prompt"))
+
+    assert llm.calls == len(llm_client.RATE_LIMIT_BACKOFF) + 1 == 4
+    assert len(sleeps) == 3
+
+
+def test_backoff_is_jittered_around_schedule(sleeps):
+    llm = _RateLimitedLLM(failures=3)
+
+    assert asyncio.run(llm_client.ainvoke_llm(llm, "prompt")) == "prompt"
+
+    jitter = llm_client.RATE_LIMIT_JITTER
+    for wait, delay in zip(sleeps, llm_client.RATE_LIMIT_BACKOFF):
+        assert delay * (1 - jitter) <= wait <= delay * (1 + jitter)
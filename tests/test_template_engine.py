@@ -0,0 +1,120 @@
+"""
+Tests for template compilation and rendering.
+"""
+
+import threading
+
+import pytest
+
+from src.models.templates import TemplateModel, TemplateSection
+from src.templates.product_template import get_product_template
+from src.templates.template_engine import TemplateEngine
+
+
+TEMPLATE = TemplateModel(
+    template_type="test",
+    sections=[
+        TemplateSection(section_name="first", required_blocks=["a"], optional_blocks=["b"]),
+        TemplateSection(section_name="second", required_blocks=["c"]),
+    ],
+)
+
+
+def _block(name):
+    return lambda product: {"block": name}
+
+
+def test_compile_is_cached_per_template():
+    engine = TemplateEngine()
+    engine.register_block("a", _block("a"))
+
+    assert engine.compile(TEMPLATE) is engine.compile(TEMPLATE)
+
+
+def test_unregistered_blocks_are_left_out_of_the_plan():
+    engine = TemplateEngine()
+    engine.register_block("a", _block("a"))
+
+    compiled = engine.compile(TEMPLATE)
+
+    assert compiled.section_names == ("first", "second")
+    assert [(index, name, required) for index, name, _, required in compiled.plan] == [
+        (0, "a", True)
+    ]
+
+
+def test_register_block_invalidates_compiled_plans():
+    engine = TemplateEngine()
+    engine.register_block("a", _block("a"))
+    before = engine.compile(TEMPLATE)
+
+    engine.register_block("c", _block("c"))
+    after = engine.compile(TEMPLATE)
+
+    assert after is not before
+    assert [name for _, name, _, _ in after.plan] == ["a", "c"]
+
+
+def test_non_callable_block_is_rejected():
+    engine = TemplateEngine()
+
+    with pytest.raises(TypeError):
+        engine.register_block("a", "not a function")
+
+
+def test_render_keeps_declared_order_when_blocks_run_concurrently(product):
+    engine = TemplateEngine()
+    release = threading.Event()
+
+    def slow(product):
+        release.wait(timeout=5)
+        return {"block": "a"}
+
+    def fast(product):
+        release.set()
+        return {"block": "b"}
+
+    engine.register_block("a", slow)
+    engine.register_block("b", fast)
+    engine.register_block("c", _block("c"))
+
+    page = engine.render_template(TEMPLATE, product)
+
+    assert page["template_type"] == "test"
+    assert [[b["name"] for b in s["blocks"]] for s in page["sections"]] == [["a", "b"], ["c"]]
+
+
+def test_failed_optional_block_is_skipped(product):
+    engine = TemplateEngine()
+
+    def broken(product):
+        raise RuntimeError("boom")
+
+    engine.register_block("a", _block("a"))
+    engine.register_block("b", broken)
+
+    page = engine.render_template(TEMPLATE, product)
+
+    assert [b["name"] for b in page["sections"][0]["blocks"]] == ["a"]
+
+
+def test_failed_required_block_propagates(product):
+    engine = TemplateEngine()
+
+    def broken(product):
+        raise RuntimeError("boom")
+
+    engine.register_block("a", broken)
+    engine.register_block("c", _block("c"))
+
+    with pytest.raises(RuntimeError):
+        engine.render_template(TEMPLATE, product)
+
+
+def test_shared_template_format_rules_are_read_only():
+    template = get_product_template()
+
+    with pytest.raises(TypeError):
+        template.sections[0].format_rules["style"] = "changed"
+
+    assert isinstance(template.model_dump()["sections"][0]["format_rules"], dict)